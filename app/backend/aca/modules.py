@@ -1,61 +1,224 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Tuple
 
 from app.backend.aca import policies
-from app.backend.aca.trace import make_event
-from app.backend.aca.types import ACAState
+from app.backend.aca.trace import now_iso
+from app.backend.aca.types import (
+    ACAModuleOutput,
+    ACAState,
+    M0Output,
+    M1Output,
+    M2Output,
+    M3Output,
+    M4Output,
+    M5Output,
+    M6Output,
+    M7Output,
+    M8Output,
+    M9Output,
+    M10Output,
+    M11Output,
+    M12Output,
+    M13Output,
+    M14Output,
+    M14SkippedOutput,
+    M15Output,
+    M16Output,
+    M17Output,
+    M18Output,
+    M19Output,
+    M20Output,
+    M21Output,
+    M22Output,
+    M23Output,
+)
 
 BuildResultFn = Callable[..., Dict[str, object]]
 
+# Unicode-aware alphanumeric runs, matching str.isalnum() boundaries.
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+_TASK_TYPE_RULES = (
+    ("SYSTEM_DESIGN", frozenset({"design", "architecture", "system"})),
+    ("PLANNING", frozenset({"plan", "roadmap", "milestone"})),
+    ("TROUBLESHOOTING", frozenset({"debug", "fix", "error"})),
+    ("DEEP_EXPLANATION", frozenset({"explain", "teach"})),
+)
+# keyword -> index of its rule; lower index wins, as in the ordered rule scan.
+_TASK_KEYWORD_RANK = {keyword: rank for rank, (_tag, keywords) in enumerate(_TASK_TYPE_RULES) for keyword in keywords}
+
+# Substring markers (not whole words) that flag a line as a constraint in M10.
+_CONSTRAINT_MARKER_RE = re.compile(r"must|should|within|deadline|cannot|budget|risk")
+
+_ACCEPTANCE_MARKERS = ("acceptance", "verify", "validation", "check")
+
+# Fixed mixer/seed-scoring weight order; "safety" carries the floor.
+_WEIGHT_KEYS = ("clarity", "depth", "alignment", "safety", "energy_fit")
+_SAFETY_INDEX = _WEIGHT_KEYS.index("safety")
+# M15 raw score per weight key: (weight_key, quality_field).
+_SEED_SCORE_SOURCES = (
+    ("clarity", "clarity"),
+    ("depth", "completeness"),
+    ("alignment", "format_compliance"),
+    ("safety", "safety"),
+    ("energy_fit", "overall"),
+)
+
+# Quality block for deterministic safety clarify results (M14 injection guard, M22 block).
+_SAFE_CLARIFY_QUALITY: Dict[str, Any] = {
+    "clarity": 9,
+    "completeness": 8,
+    "safety": 10,
+    "format_compliance": 9,
+    "overall": 9.0,
+    "revision_required": False,
+}
+_INJECTION_QUESTIONS = (
+    "Restate your goal without requesting hidden prompts or policy bypass steps.",
+    "List the safe output you want from the assistant.",
+)
+_INJECTION_FALLBACK: Dict[str, Any] = {
+    "triggered": True,
+    "reason_code": "prompt_injection_detected",
+    "strategy": "safety_clarify",
+}
+_INJECTION_FALLBACK_NOTES = ("Provider execution skipped due to safety policy.",)
+
+# Static trace identity per module: module_id -> (module_name, tier).
+_MODULE_META: Dict[str, Tuple[str, str]] = {
+    "M0": ("SafetyMemoryGuard", "tier0_safety"),
+    "M1": ("IdentityGate", "tier3_operational"),
+    "M2": ("PreferenceLoader", "tier3_operational"),
+    "M3": ("MetaController", "tier1_meta"),
+    "M4": ("ModeSystem", "tier3_operational"),
+    "M5": ("PathSelector", "tier3_operational"),
+    "M6": ("LandsMixer", "tier3_operational"),
+    "M7": ("EmotionalRegulation", "tier3_operational"),
+    "M8": ("BottleneckMonitor", "tier2_bottleneck"),
+    "M9": ("SparseAttentionDSA", "tier3_operational"),
+    "M10": ("ProcessEngine", "tier3_operational"),
+    "M11": ("DecisionTreeBuilder", "tier3_operational"),
+    "M12": ("AIMPhase1", "tier3_operational"),
+    "M13": ("EveSupraClean", "tier3_operational"),
+    "M14": ("EveCore", "tier3_operational"),
+    "M15": ("SeedScoring", "tier3_operational"),
+    "M16": ("RefinementLoop", "tier3_operational"),
+    "M17": ("ConflictResolution", "tier3_operational"),
+    "M18": ("TaskIntegrity", "tier3_operational"),
+    "M19": ("ErrorCoherenceChecker", "tier3_operational"),
+    "M20": ("FallbackManager", "tier3_operational"),
+    "M21": ("AIMPhase2", "tier3_operational"),
+    "M22": ("SafetyAlignment", "tier0_safety"),
+    "M23": ("InterfaceLayer", "tier3_operational"),
+}
+
+
+def _append_trace(state: ACAState, module_id: str, *, status: str, detail: str) -> None:
+    module_name, tier = _MODULE_META[module_id]
+    state.trace.record(module_id, module_name, tier, status, detail, state.trace_timestamp or now_iso())  # type: ignore[arg-type]
+
+
+def _set_output(state: ACAState, module_id: str, payload: ACAModuleOutput | Dict[str, Any]) -> None:
+    state.module_outputs[module_id] = payload
 
-def _append_trace(state: ACAState, *, module_id: str, module_name: str, tier: str, status: str, detail: str) -> None:
-    state.trace.append(
-        make_event(
-            module_id=module_id,
-            module_name=module_name,
-            tier=tier,  # type: ignore[arg-type]
-            status=status,  # type: ignore[arg-type]
-            detail=detail,
-        )
-    )
 
+def _set_working_context(state: ACAState, context: str | None) -> None:
+    state.working_context = context
+    state.working_context_lower = context.lower() if context else ""
 
-def _set_output(state: ACAState, module_id: str, payload: Dict[str, Any]) -> None:
-    state.module_outputs[module_id] = payload
+
+def _collapse_ws(text: str) -> str:
+    # split()/join() beats re.sub(r"\s+") here and never leaves edge spaces, so no strip() is needed.
+    return " ".join(text.split())
 
 
-def _tokens(text: str) -> List[str]:
-    return [t for t in "".join(ch if ch.isalnum() else " " for ch in text.lower()).split() if t]
+@lru_cache(maxsize=1024)
+def _tokens(text: str) -> Tuple[str, ...]:
+    return tuple(_TOKEN_RE.findall(text.lower()))
 
 
 def _normalize_weights(weights: Dict[str, float], safety_floor: float = 0.15) -> Dict[str, float]:
-    clean = {k: max(0.0, float(v)) for k, v in weights.items()}
-    total = sum(clean.values()) or 1.0
-    clean = {k: v / total for k, v in clean.items()}
-    if clean.get("safety", 0.0) >= safety_floor:
-        return clean
-    deficit = safety_floor - clean.get("safety", 0.0)
-    keys = [k for k in clean if k != "safety" and clean[k] > 0]
-    spread = sum(clean[k] for k in keys) or 1.0
-    clean["safety"] = safety_floor
-    for key in keys:
-        clean[key] = max(0.0, clean[key] - deficit * (clean[key] / spread))
-    total2 = sum(clean.values()) or 1.0
-    return {k: v / total2 for k, v in clean.items()}
+    values = [max(0.0, float(weights.get(key, 0.0))) for key in _WEIGHT_KEYS]
+    total = sum(values) or 1.0
+    values = [value / total for value in values]
+    safety = values[_SAFETY_INDEX]
+    if safety >= safety_floor:
+        return dict(zip(_WEIGHT_KEYS, values))
+    deficit = safety_floor - safety
+    spread = sum(value for idx, value in enumerate(values) if idx != _SAFETY_INDEX and value > 0) or 1.0
+    values = [
+        safety_floor if idx == _SAFETY_INDEX else max(0.0, value - deficit * (value / spread))
+        for idx, value in enumerate(values)
+    ]
+    total = sum(values) or 1.0
+    return dict(zip(_WEIGHT_KEYS, [value / total for value in values]))
+
+
+@lru_cache(maxsize=64)
+def _rounded_weights(values: Tuple[float, ...]) -> Tuple[float, ...]:
+    return tuple(round(value, 4) for value in values)
+
+
+def _weighted_score(weights: Dict[str, float], scores: Dict[str, float]) -> float:
+    total = 0.0
+    for key in _WEIGHT_KEYS:
+        total += scores[key] * weights[key]
+    return total
 
 
+@lru_cache(maxsize=1024)
 def _task_type(user_input: str) -> str:
-    tokens = set(_tokens(user_input))
-    if tokens & {"design", "architecture", "system"}:
-        return "SYSTEM_DESIGN"
-    if tokens & {"plan", "roadmap", "milestone"}:
-        return "PLANNING"
-    if tokens & {"debug", "fix", "error"}:
-        return "TROUBLESHOOTING"
-    if tokens & {"explain", "teach"}:
-        return "DEEP_EXPLANATION"
-    return "FACTUAL_ANSWER"
+    best = len(_TASK_TYPE_RULES)
+    for token in _tokens(user_input):
+        rank = _TASK_KEYWORD_RANK.get(token, best)
+        if rank < best:
+            best = rank
+            if best == 0:
+                break
+    return _TASK_TYPE_RULES[best][0] if best < len(_TASK_TYPE_RULES) else "FACTUAL_ANSWER"
+
+
+def _lowered_plan(state: ACAState, plan: List[Any]) -> List[str]:
+    if state.plan_lower_source is not plan:
+        state.plan_lower = [_collapse_ws(str(step)).lower() for step in plan]
+        state.plan_lower_source = plan
+        state.plan_normalized = False
+    return state.plan_lower
+
+
+def _store_plan(state: ACAState, plan: List[str], lowered: List[str]) -> None:
+    state.result["plan"] = plan
+    state.plan_lower = lowered
+    state.plan_lower_source = plan
+    state.plan_normalized = True
+
+
+def _append_notes(state: ACAState, *markers: str) -> None:
+    notes = state.result.get("notes") if isinstance(state.result.get("notes"), list) else []
+    seen = set(notes)
+    for marker in markers:
+        if marker not in seen:
+            seen.add(marker)
+            notes.append(marker)
+    state.result["notes"] = notes
+
+
+def _plan_coverage(lowered_steps: List[str]) -> Tuple[bool, bool, bool]:
+    has_gate = has_acceptance = has_fallback = False
+    for step in lowered_steps:
+        if not has_gate and "gate" in step:
+            has_gate = True
+        if not has_acceptance and any(marker in step for marker in _ACCEPTANCE_MARKERS):
+            has_acceptance = True
+        if not has_fallback and "fallback" in step:
+            has_fallback = True
+        if has_gate and has_acceptance and has_fallback:
+            break
+    return has_gate, has_acceptance, has_fallback
 
 
 def _default_quality(result: Dict[str, object]) -> Dict[str, Any]:
@@ -75,12 +238,12 @@ def _default_quality(result: Dict[str, object]) -> Dict[str, Any]:
 
 
 def run_m0_safety_memory_guard(state: ACAState) -> None:
-    state.working_input = " ".join(state.request.user_input.split()).strip()
+    state.working_input = _collapse_ws(state.request.user_input)
+    state.working_input_lower = state.working_input.lower()
     context = state.request.context.strip() if state.request.context else ""
-    state.working_context = context or None
+    _set_working_context(state, context or None)
     combo = f"{state.working_input}\n{context}".strip()
-    state.prompt_injection_detected = policies.detect_prompt_injection(combo)
-    state.untrusted_tool_instruction_detected = policies.detect_untrusted_tool_instruction(combo)
+    state.prompt_injection_detected, state.untrusted_tool_instruction_detected = policies.scan_input_threats(combo)
     if state.prompt_injection_detected or state.untrusted_tool_instruction_detected:
         state.meta_policy["safety_override"] = True
     state.safety = {
@@ -94,17 +257,14 @@ def run_m0_safety_memory_guard(state: ACAState) -> None:
     _set_output(
         state,
         "M0",
-        {
-            "prompt_injection_detected": state.prompt_injection_detected,
-            "untrusted_tool_instruction_detected": state.untrusted_tool_instruction_detected,
-            "memory_policy": "session_sanitized_only",
-        },
+        M0Output(
+            prompt_injection_detected=state.prompt_injection_detected,
+            untrusted_tool_instruction_detected=state.untrusted_tool_instruction_detected,
+        ),
     )
     _append_trace(
         state,
-        module_id="M0",
-        module_name="SafetyMemoryGuard",
-        tier="tier0_safety",
+        "M0",
         status="adjusted" if (state.prompt_injection_detected or state.untrusted_tool_instruction_detected) else "pass",
         detail=(
             "Prompt-injection or untrusted tool-instruction detected; safety override engaged."
@@ -115,14 +275,14 @@ def run_m0_safety_memory_guard(state: ACAState) -> None:
 
 
 def run_m1_identity_gate(state: ACAState) -> None:
-    text = f"{state.working_input}\n{state.working_context or ''}".lower()
-    state.identity_tag = "ALVIN" if "alvin" in text else ("JAZ" if "jaz" in text else "GENERIC")
-    _set_output(state, "M1", {"identity_tag": state.identity_tag})
-    _append_trace(state, module_id="M1", module_name="IdentityGate", tier="tier3_operational", status="pass", detail=f"Identity tag selected: {state.identity_tag}.")
+    text, context = state.working_input_lower, state.working_context_lower
+    state.identity_tag = "ALVIN" if "alvin" in text or "alvin" in context else ("JAZ" if "jaz" in text or "jaz" in context else "GENERIC")
+    _set_output(state, "M1", M1Output(identity_tag=state.identity_tag))
+    _append_trace(state, "M1", status="pass", detail=f"Identity tag selected: {state.identity_tag}.")
 
 
 def run_m2_preference_loader(state: ACAState) -> None:
-    context = (state.working_context or "").lower()
+    context = state.working_context_lower
     pacing = "concise" if "concise" in context else ("verbose" if "verbose" in context else "balanced")
     state.preferences = {
         "tone_preference": "technical",
@@ -130,8 +290,8 @@ def run_m2_preference_loader(state: ACAState) -> None:
         "structural_preference": "mixed",
         "verbosity_level": 2 if pacing == "concise" else (4 if pacing == "verbose" else 3),
     }
-    _set_output(state, "M2", state.preferences.copy())
-    _append_trace(state, module_id="M2", module_name="PreferenceLoader", tier="tier3_operational", status="pass", detail=f"Preferences loaded: pacing={pacing}.")
+    _set_output(state, "M2", M2Output(**state.preferences))
+    _append_trace(state, "M2", status="pass", detail=f"Preferences loaded: pacing={pacing}.")
 
 
 def run_m3_meta_controller(state: ACAState) -> None:
@@ -143,23 +303,23 @@ def run_m3_meta_controller(state: ACAState) -> None:
             "refinement_budgets": {"FAST": 0, "BALANCED": 2, "DEEP": 8},
         }
     )
-    _set_output(state, "M3", {"risk_tolerance": state.request.risk_tolerance, "safety_locked": bool(state.meta_policy.get("safety_locked"))})
-    _append_trace(state, module_id="M3", module_name="MetaController", tier="tier1_meta", status="adjusted" if state.meta_policy.get("safety_locked") else "pass", detail="Meta policy set.")
+    _set_output(state, "M3", M3Output(risk_tolerance=state.request.risk_tolerance, safety_locked=bool(state.meta_policy.get("safety_locked"))))
+    _append_trace(state, "M3", status="adjusted" if state.meta_policy.get("safety_locked") else "pass", detail="Meta policy set.")
 
 
 def run_m4_mode_system(state: ACAState) -> None:
     mode = "support" if state.meta_policy.get("safety_locked") else "architect"
     state.mode_context = {"mode": mode}
-    _set_output(state, "M4", state.mode_context.copy())
-    _append_trace(state, module_id="M4", module_name="ModeSystem", tier="tier3_operational", status="pass", detail=f"Mode selected: {mode}.")
+    _set_output(state, "M4", M4Output(**state.mode_context))
+    _append_trace(state, "M4", status="pass", detail=f"Mode selected: {mode}.")
 
 
 def run_m5_path_selector(state: ACAState) -> None:
     length = len(state.working_input)
     path_type = "DEEP" if state.request.risk_tolerance == "high" or length > 180 else ("FAST" if length < 40 else "BALANCED")
     state.path_context = {"path_type": path_type}
-    _set_output(state, "M5", {"path_type": path_type, "input_length": length})
-    _append_trace(state, module_id="M5", module_name="PathSelector", tier="tier3_operational", status="pass", detail=f"Path selected: {path_type}.")
+    _set_output(state, "M5", M5Output(path_type=path_type, input_length=length))
+    _append_trace(state, "M5", status="pass", detail=f"Path selected: {path_type}.")
 
 
 def run_m6_lands_mixer(state: ACAState) -> None:
@@ -173,16 +333,16 @@ def run_m6_lands_mixer(state: ACAState) -> None:
     if state.meta_policy.get("safety_locked"):
         weights["safety"] += 0.1
     state.mixer_context = _normalize_weights(weights, safety_floor=0.15)
-    _set_output(state, "M6", {"weights": state.mixer_context.copy(), "safety_floor": 0.15})
-    _append_trace(state, module_id="M6", module_name="LandsMixer", tier="tier3_operational", status="pass", detail="Mixer weights normalized with safety floor enforcement.")
+    _set_output(state, "M6", M6Output(weights=MappingProxyType(state.mixer_context), safety_floor=0.15))
+    _append_trace(state, "M6", status="pass", detail="Mixer weights normalized with safety floor enforcement.")
 
 
 def run_m7_emotional_regulation(state: ACAState) -> None:
-    emotional_load = "high" if "stuck" in state.working_input.lower() else "low"
+    emotional_load = "high" if "stuck" in state.working_input_lower else "low"
     tone = "calming" if emotional_load == "high" else "steady"
     state.regulation_context = {"emotional_load": emotional_load, "tone": tone}
-    _set_output(state, "M7", state.regulation_context.copy())
-    _append_trace(state, module_id="M7", module_name="EmotionalRegulation", tier="tier3_operational", status="pass", detail=f"Regulation profile: {tone}.")
+    _set_output(state, "M7", M7Output(emotional_load=emotional_load, tone=tone))
+    _append_trace(state, "M7", status="pass", detail=f"Regulation profile: {tone}.")
 
 
 def run_m8_bottleneck_monitor(state: ACAState) -> None:
@@ -190,29 +350,30 @@ def run_m8_bottleneck_monitor(state: ACAState) -> None:
     complexity = "high" if path_type == "DEEP" else ("low" if path_type == "FAST" else "medium")
     signal = "force" if complexity == "high" and len(state.working_input) > 420 else "advisory"
     state.bottleneck_context = {"complexity_level": complexity, "signal": signal, "tier": "tier2_bottleneck"}
-    _set_output(state, "M8", state.bottleneck_context.copy())
-    _append_trace(state, module_id="M8", module_name="BottleneckMonitor", tier="tier2_bottleneck", status="adjusted" if signal == "force" or complexity == "high" else "pass", detail=f"Complexity={complexity}; signal={signal}.")
+    _set_output(state, "M8", M8Output(**state.bottleneck_context))
+    _append_trace(state, "M8", status="adjusted" if signal == "force" or complexity == "high" else "pass", detail=f"Complexity={complexity}; signal={signal}.")
 
 
 def run_m9_sparse_attention_dsa(state: ACAState) -> None:
     context = state.working_context or ""
-    trimmed = False
-    if len(context) > 1800:
-        state.working_context = context[:1800].rstrip() + "...[trimmed]"
-        trimmed = True
-    state.attention_context = {"trimmed": trimmed, "context_chars": len(state.working_context or "")}
-    _set_output(state, "M9", state.attention_context.copy())
-    _append_trace(state, module_id="M9", module_name="SparseAttentionDSA", tier="tier3_operational", status="adjusted" if trimmed else "pass", detail="Context trimmed by sparse attention policy." if trimmed else "Sparse attention pass-through.")
+    context_chars = len(context)
+    trimmed = context_chars > 1800
+    if trimmed:
+        context = context[:1800].rstrip() + "...[trimmed]"
+        context_chars = len(context)
+        _set_working_context(state, context)
+    state.attention_context = {"trimmed": trimmed, "context_chars": context_chars}
+    _set_output(state, "M9", M9Output(trimmed=trimmed, context_chars=context_chars))
+    _append_trace(state, "M9", status="adjusted" if trimmed else "pass", detail="Context trimmed by sparse attention policy." if trimmed else "Sparse attention pass-through.")
 
 def run_m10_process_engine(state: ACAState) -> None:
     constraints: List[str] = []
-    for line in (state.working_input + "\n" + (state.working_context or "")).split("\n"):
-        cleaned = " ".join(line.split()).strip()
-        if not cleaned:
-            continue
-        lowered = cleaned.lower()
-        if any(marker in lowered for marker in ["must", "should", "within", "deadline", "cannot", "budget", "risk"]):
-            constraints.append(cleaned)
+    text = state.working_input + "\n" + (state.working_context or "")
+    if _CONSTRAINT_MARKER_RE.search(state.working_input_lower) or _CONSTRAINT_MARKER_RE.search(state.working_context_lower):
+        for line in text.split("\n"):
+            cleaned = _collapse_ws(line)
+            if cleaned and _CONSTRAINT_MARKER_RE.search(cleaned.lower()):
+                constraints.append(cleaned)
     if not constraints:
         constraints.append("No explicit constraints provided; confirm constraints before irreversible changes.")
 
@@ -223,19 +384,19 @@ def run_m10_process_engine(state: ACAState) -> None:
         "Generate response draft aligned to constraints.",
         "Run refinement, integrity, and coherence gates.",
     ]
-    payload = {
-        "task_type": _task_type(state.working_input),
-        "objective": state.working_input,
-        "constraints": constraints[:5],
-        "acceptance_checks": [
+    payload = M10Output(
+        task_type=_task_type(state.working_input),
+        objective=state.working_input,
+        constraints=constraints[:5],
+        acceptance_checks=[
             "Output includes executable steps.",
             "At least one validation/checkpoint step exists.",
             "Fallback behavior is explicit.",
         ],
-        "steps": state.process_plan,
-    }
+        steps=state.process_plan,
+    )
     _set_output(state, "M10", payload)
-    _append_trace(state, module_id="M10", module_name="ProcessEngine", tier="tier3_operational", status="pass", detail=f"Process engine decomposed task with {len(payload['constraints'])} constraints.")
+    _append_trace(state, "M10", status="pass", detail=f"Process engine decomposed task with {len(payload.constraints)} constraints.")
 
 
 def run_m11_decision_tree_builder(state: ACAState) -> None:
@@ -248,9 +409,9 @@ def run_m11_decision_tree_builder(state: ACAState) -> None:
     if state.meta_policy.get("safety_locked"):
         branches.append({"branch_id": "B_SAFE", "label": "Safety fallback clarification path", "type": "fallback", "from": "B01", "pruned": False})
     state.decision_tree = branches
-    state.decision_graph = list(branches)
-    _set_output(state, "M11", {"branches": branches, "branch_count": len(branches), "pruning_rule": "prune only contradictory branches"})
-    _append_trace(state, module_id="M11", module_name="DecisionTreeBuilder", tier="tier3_operational", status="pass", detail=f"Decision graph built with {len(branches)} branches.")
+    state.decision_graph = branches
+    _set_output(state, "M11", M11Output(branches=branches, branch_count=len(branches)))
+    _append_trace(state, "M11", status="pass", detail=f"Decision graph built with {len(branches)} branches.")
 
 
 def run_m12_aim_phase_1(state: ACAState) -> None:
@@ -265,8 +426,8 @@ def run_m12_aim_phase_1(state: ACAState) -> None:
             }
         )
     state.outline = outline
-    _set_output(state, "M12", {"outline": outline, "section_count": len(outline)})
-    _append_trace(state, module_id="M12", module_name="AIMPhase1", tier="tier3_operational", status="pass", detail=f"AIM Phase 1 mapped {len(outline)} sections.")
+    _set_output(state, "M12", M12Output(outline=outline, section_count=len(outline)))
+    _append_trace(state, "M12", status="pass", detail=f"AIM Phase 1 mapped {len(outline)} sections.")
 
 
 def run_m13_eve_supra_clean(state: ACAState) -> None:
@@ -276,42 +437,31 @@ def run_m13_eve_supra_clean(state: ACAState) -> None:
     if state.meta_policy.get("safety_locked") and state.mode_context.get("mode") != "support":
         contradictions.append("Safety lock requires support mode.")
     if state.working_context:
-        state.working_context = " ".join(state.working_context.split())
-    _set_output(state, "M13", {"contradictions": contradictions, "context_sanitized": bool(state.working_context)})
+        _set_working_context(state, _collapse_ws(state.working_context))
+    _set_output(state, "M13", M13Output(contradictions=contradictions, context_sanitized=bool(state.working_context)))
     _append_trace(
         state,
-        module_id="M13",
-        module_name="EveSupraClean",
-        tier="tier3_operational",
+        "M13",
         status="adjusted" if contradictions else "pass",
         detail=f"Supra clean flagged {len(contradictions)} contradictions." if contradictions else "Supra clean checks completed.",
     )
 
 
 def _injection_safe_result(state: ACAState) -> Dict[str, object]:
-    fallback = {
-        "triggered": True,
-        "reason_code": "prompt_injection_detected",
-        "strategy": "safety_clarify",
-        "notes": ["Provider execution skipped due to safety policy."],
-    }
+    # Sub-dicts are copied per call: M14-M23 mutate quality, notes and fallback in place.
+    fallback = dict(_INJECTION_FALLBACK)
+    if state.untrusted_tool_instruction_detected:
+        fallback["reason_code"] = "untrusted_tool_instruction_detected"
+        fallback["notes"] = [*_INJECTION_FALLBACK_NOTES, "tool_output_treated_as_untrusted_data"]
+    else:
+        fallback["notes"] = list(_INJECTION_FALLBACK_NOTES)
     return {
         "mode": "clarify",
         "ambiguity_score": 1.0,
-        "recommended_questions": [
-            "Restate your goal without requesting hidden prompts or policy bypass steps.",
-            "List the safe output you want from the assistant.",
-        ][: state.request.max_questions],
+        "recommended_questions": list(_INJECTION_QUESTIONS[: state.request.max_questions]),
         "plan": [],
         "candidate_response": "I cannot execute prompt-injection or policy-bypass instructions. Please restate your request safely.",
-        "quality": {
-            "clarity": 9,
-            "completeness": 8,
-            "safety": 10,
-            "format_compliance": 9,
-            "overall": 9.0,
-            "revision_required": False,
-        },
+        "quality": dict(_SAFE_CLARIFY_QUALITY),
         "iteration_count": 1,
         "notes": ["prompt_injection_detected", "safety_override_applied"],
         "fallback": fallback,
@@ -321,34 +471,22 @@ def _injection_safe_result(state: ACAState) -> Dict[str, object]:
 def run_m14_eve_core(state: ACAState, build_result: BuildResultFn) -> None:
     if state.prompt_injection_detected or state.untrusted_tool_instruction_detected:
         state.result = _injection_safe_result(state)
-        if state.untrusted_tool_instruction_detected:
-            fallback = state.result.get("fallback")
-            if isinstance(fallback, dict):
-                fallback["reason_code"] = "untrusted_tool_instruction_detected"
-                fallback["notes"] = list(dict.fromkeys([*(fallback.get("notes") or []), "tool_output_treated_as_untrusted_data"]))
         state.fallback = dict(state.result.get("fallback") or {})
         _set_output(
             state,
             "M14",
-            {
-                "provider_executed": False,
-                "provider_mode": state.request.provider_mode,
-                "model": state.request.model,
-                "reason": (
+            M14SkippedOutput(
+                provider_executed=False,
+                provider_mode=state.request.provider_mode,
+                model=state.request.model,
+                reason=(
                     "untrusted_tool_instruction_detected"
                     if state.untrusted_tool_instruction_detected
                     else "prompt_injection_detected"
                 ),
-            },
-        )
-        _append_trace(
-            state,
-            module_id="M14",
-            module_name="EveCore",
-            tier="tier3_operational",
-            status="fallback",
-            detail="Provider execution skipped due to safety override.",
+            ),
         )
+        _append_trace(state, "M14", status="fallback", detail="Provider execution skipped due to safety override.")
         return
 
     result = build_result(
@@ -360,8 +498,10 @@ def run_m14_eve_core(state: ACAState, build_result: BuildResultFn) -> None:
         model=state.request.model,
     )
     state.result = result if isinstance(result, dict) else {}
-    _set_output(state, "M14", {"provider_executed": True, "provider_mode": state.request.provider_mode, "model": state.request.model, "result_mode": str(state.result.get("mode") or "unknown")})
-    _append_trace(state, module_id="M14", module_name="EveCore", tier="tier3_operational", status="pass", detail="Provider reasoning output received.")
+    # The provider call is the only slow step; later modules are stamped after it.
+    state.trace_timestamp = now_iso()
+    _set_output(state, "M14", M14Output(provider_executed=True, provider_mode=state.request.provider_mode, model=state.request.model, result_mode=str(state.result.get("mode") or "unknown")))
+    _append_trace(state, "M14", status="pass", detail="Provider reasoning output received.")
 
 
 def run_m15_seed_scoring(state: ACAState) -> None:
@@ -376,72 +516,73 @@ def run_m15_seed_scoring(state: ACAState) -> None:
         },
         safety_floor=0.15,
     )
-    raw_scores = {
-        "clarity": float(quality.get("clarity", 0.0)),
-        "depth": float(quality.get("completeness", 0.0)),
-        "alignment": float(quality.get("format_compliance", 0.0)),
-        "safety": float(quality.get("safety", 0.0)),
-        "energy_fit": float(quality.get("overall", 0.0)),
-    }
-    state.quality_score = round(sum(raw_scores[k] * weights.get(k, 0.0) for k in raw_scores), 2)
+    raw_scores = {key: float(quality.get(source, 0.0)) for key, source in _SEED_SCORE_SOURCES}
+    state.quality_score = round(_weighted_score(weights, raw_scores), 2)
     quality["aca_seed_score"] = state.quality_score
-    quality["aca_weights"] = {k: round(v, 4) for k, v in weights.items()}
-    _set_output(state, "M15", {"weights": weights, "raw_scores": raw_scores, "weighted_score": state.quality_score, "safety_floor": 0.15})
-    _append_trace(state, module_id="M15", module_name="SeedScoring", tier="tier3_operational", status="pass", detail=f"Seed quality scored at {state.quality_score:.2f}.")
+    quality["aca_weights"] = dict(zip(_WEIGHT_KEYS, _rounded_weights(tuple(weights.values()))))
+    _set_output(state, "M15", M15Output(weights=weights, raw_scores=raw_scores, weighted_score=state.quality_score, safety_floor=0.15))
+    _append_trace(state, "M15", status="pass", detail=f"Seed quality scored at {state.quality_score:.2f}.")
 
 
 def run_m16_refinement_loop(state: ACAState) -> None:
     plan = state.result.get("plan") if isinstance(state.result.get("plan"), list) else []
-    plan = [" ".join(str(item).split()).strip() for item in plan if str(item).strip()]
+    plan = [step for step in (_collapse_ws(str(item)) for item in plan) if step]
     path_type = str(state.path_context.get("path_type", "BALANCED")).upper()
     budget = {"FAST": 0, "BALANCED": 2, "DEEP": 8}.get(path_type, 2)
     modifications: List[str] = []
+    lowered = [step.lower() for step in plan]
     if state.result.get("mode") == "plan_execute":
-        if not any("gate" in step.lower() for step in plan):
+        has_gate, has_acceptance, has_fallback = _plan_coverage(lowered)
+        if not has_gate:
             plan.insert(0, "Input gate: confirm objective, scope, and constraints before execution.")
             modifications.append("added_gate_step")
-        if not any(any(token in step.lower() for token in ["acceptance", "verify", "validation", "check"]) for step in plan):
+        if not has_acceptance:
             plan.append("Acceptance check: verify behavior with deterministic tests before handoff.")
             modifications.append("added_acceptance_step")
-        if not any("fallback" in step.lower() for step in plan):
+        if not has_fallback:
             plan.append("Fallback policy: retry with simplified strategy, then request clarification.")
             modifications.append("added_fallback_step")
         while len(plan) < 4:
             plan.append("Execution step: implement the next smallest testable increment.")
             modifications.append("expanded_minimum_depth")
-    state.result["plan"] = plan
+    if modifications:
+        lowered = [step.lower() for step in plan]
+    _store_plan(state, plan, lowered)
     current = state.result.get("iteration_count") if isinstance(state.result.get("iteration_count"), int) else 1
     used = 0 if budget == 0 else min(budget, max(1, len(modifications)))
     state.result["iteration_count"] = max(int(current), used)
-    _set_output(state, "M16", {"path_type": path_type, "budget": budget, "iterations_used": used, "modifications": modifications})
-    _append_trace(state, module_id="M16", module_name="RefinementLoop", tier="tier3_operational", status="adjusted" if modifications else "pass", detail=f"Refinement modifications={len(modifications)} budget={budget}.")
+    _set_output(state, "M16", M16Output(path_type=path_type, budget=budget, iterations_used=used, modifications=modifications))
+    _append_trace(state, "M16", status="adjusted" if modifications else "pass", detail=f"Refinement modifications={len(modifications)} budget={budget}.")
 
 
 def run_m17_conflict_resolution(state: ACAState) -> None:
     plan = state.result.get("plan") if isinstance(state.result.get("plan"), list) else []
     cleaned: List[str] = []
+    cleaned_lower: List[str] = []
     seen: set[str] = set()
-    for item in plan:
-        text = " ".join(str(item).split()).strip()
-        key = text.lower()
-        if text and key not in seen:
+    normalized = plan is state.plan_lower_source and state.plan_normalized
+    for item, key in zip(plan, _lowered_plan(state, plan)):
+        if key and key not in seen:
             seen.add(key)
-            cleaned.append(text)
+            cleaned.append(item if normalized else _collapse_ws(str(item)))
+            cleaned_lower.append(key)
     strategy = "dedupe" if len(cleaned) != len(plan) else "none"
-    if any("cannot" in step.lower() for step in cleaned) and any("must" in step.lower() for step in cleaned):
+    if any("cannot" in key for key in cleaned_lower) and any("must" in key for key in cleaned_lower):
         strategy = "precedence_safety"
-        cleaned = [step for step in cleaned if "must" not in step.lower() or "safe" in step.lower()]
-    state.result["plan"] = cleaned
+        kept = [idx for idx, key in enumerate(cleaned_lower) if "must" not in key or "safe" in key]
+        cleaned = [cleaned[idx] for idx in kept]
+        cleaned_lower = [cleaned_lower[idx] for idx in kept]
+    _store_plan(state, cleaned, cleaned_lower)
     _set_output(
         state,
         "M17",
-        {
-            "strategy_cascade": ["safety_precedence", "policy_alignment", "constraint_consistency", "dedupe_merge", "fallback_to_safe_default"],
-            "strategy_used": strategy,
-            "plan_length": len(cleaned),
-        },
+        M17Output(
+            strategy_cascade=["safety_precedence", "policy_alignment", "constraint_consistency", "dedupe_merge", "fallback_to_safe_default"],
+            strategy_used=strategy,
+            plan_length=len(cleaned),
+        ),
     )
-    _append_trace(state, module_id="M17", module_name="ConflictResolution", tier="tier3_operational", status="adjusted" if strategy != "none" else "pass", detail=f"Conflict strategy={strategy}.")
+    _append_trace(state, "M17", status="adjusted" if strategy != "none" else "pass", detail=f"Conflict strategy={strategy}.")
 
 def run_m18_task_integrity(state: ACAState) -> None:
     failures: List[str] = []
@@ -456,36 +597,32 @@ def run_m18_task_integrity(state: ACAState) -> None:
     if mode == "plan_execute":
         if len(plan) < 4:
             failures.append("insufficient_plan_depth")
-        if not any(any(token in str(step).lower() for token in ["acceptance", "verify", "validation", "check"]) for step in plan):
+        _has_gate, has_acceptance, has_fallback = _plan_coverage(_lowered_plan(state, plan))
+        if not has_acceptance:
             failures.append("missing_acceptance_check")
-        if not any("fallback" in str(step).lower() for step in plan):
+        if not has_fallback:
             failures.append("missing_fallback_step")
 
     passed = not failures
     if not passed:
         state.meta_policy["integrity_fail"] = True
         state.meta_policy.setdefault("fallback_reason", "integrity_check_failed")
-        notes = state.result.get("notes") if isinstance(state.result.get("notes"), list) else []
-        for failure in failures:
-            marker = f"integrity:{failure}"
-            if marker not in notes:
-                notes.append(marker)
-        state.result["notes"] = notes
+        _append_notes(state, *(f"integrity:{failure}" for failure in failures))
 
     _set_output(
         state,
         "M18",
-        {
-            "pass": passed,
-            "failures": failures,
-            "checks": {
+        M18Output(
+            passed=passed,
+            failures=failures,
+            checks={
                 "mode_valid": mode in {"clarify", "plan_execute"},
                 "candidate_present": bool(candidate),
                 "plan_depth_ok": len(plan) >= 4 if mode == "plan_execute" else True,
             },
-        },
+        ),
     )
-    _append_trace(state, module_id="M18", module_name="TaskIntegrity", tier="tier3_operational", status="blocked" if failures else "pass", detail=f"Task integrity {'failed' if failures else 'passed'}.")
+    _append_trace(state, "M18", status="blocked" if failures else "pass", detail=f"Task integrity {'failed' if failures else 'passed'}.")
 
 
 def run_m19_error_coherence(state: ACAState) -> None:
@@ -507,8 +644,8 @@ def run_m19_error_coherence(state: ACAState) -> None:
         state.meta_policy["coherence_fail"] = True
         state.meta_policy.setdefault("fallback_reason", "coherence_check_failed")
 
-    _set_output(state, "M19", {"pass": passed, "issues": issues, "quality_score": state.quality_score})
-    _append_trace(state, module_id="M19", module_name="ErrorCoherenceChecker", tier="tier3_operational", status="blocked" if issues else "pass", detail=f"Coherence {'failed' if issues else 'passed'}.")
+    _set_output(state, "M19", M19Output(passed=passed, issues=issues, quality_score=state.quality_score))
+    _append_trace(state, "M19", status="blocked" if issues else "pass", detail=f"Coherence {'failed' if issues else 'passed'}.")
 
 
 def run_m20_fallback_manager(state: ACAState) -> None:
@@ -554,15 +691,13 @@ def run_m20_fallback_manager(state: ACAState) -> None:
         )
         quality = _default_quality(state.result)
         quality.update({"safety": max(9, int(quality.get("safety", 9))), "overall": max(7.5, float(quality.get("overall", 7.5)))})
-        notes = state.result.get("notes") if isinstance(state.result.get("notes"), list) else []
-        notes.append(f"fallback:{reason_code}")
-        state.result["notes"] = list(dict.fromkeys(notes))
+        _append_notes(state, f"fallback:{reason_code}")
         fallback["notes"].append("Returned clarify response due to deterministic guard failure.")
 
     state.fallback = fallback
     state.result["fallback"] = fallback
-    _set_output(state, "M20", fallback.copy())
-    _append_trace(state, module_id="M20", module_name="FallbackManager", tier="tier3_operational", status="fallback" if triggered else "pass", detail=f"Fallback {'triggered' if triggered else 'not_triggered'} ({reason_code}).")
+    _set_output(state, "M20", M20Output(**fallback))
+    _append_trace(state, "M20", status="fallback" if triggered else "pass", detail=f"Fallback {'triggered' if triggered else 'not_triggered'} ({reason_code}).")
 
 
 def run_m21_aim_phase_2(state: ACAState) -> None:
@@ -574,8 +709,8 @@ def run_m21_aim_phase_2(state: ACAState) -> None:
     if state.result.get("mode") == "plan_execute" and plan and not candidate.startswith("1."):
         state.result["candidate_response"] = "Proposed execution path:\n" + "\n".join(f"{idx}. {str(step).strip()}" for idx, step in enumerate(plan, start=1))
         candidate = str(state.result.get("candidate_response") or "")
-    _set_output(state, "M21", {"formatted": bool(candidate), "candidate_chars": len(candidate), "mode": state.result.get("mode", "clarify")})
-    _append_trace(state, module_id="M21", module_name="AIMPhase2", tier="tier3_operational", status="adjusted" if candidate else "pass", detail="Output formatting pass completed.")
+    _set_output(state, "M21", M21Output(formatted=bool(candidate), candidate_chars=len(candidate), mode=state.result.get("mode", "clarify")))
+    _append_trace(state, "M21", status="adjusted" if candidate else "pass", detail="Output formatting pass completed.")
 
 
 def run_m22_safety_alignment(state: ACAState) -> None:
@@ -587,14 +722,7 @@ def run_m22_safety_alignment(state: ACAState) -> None:
             "recommended_questions": ["Please restate your request with a safe and lawful objective."],
             "plan": [],
             "candidate_response": "I cannot provide unsafe guidance. Please provide a safer request.",
-            "quality": {
-                "clarity": 9,
-                "completeness": 8,
-                "safety": 10,
-                "format_compliance": 9,
-                "overall": 9.0,
-                "revision_required": False,
-            },
+            "quality": dict(_SAFE_CLARIFY_QUALITY),
             "iteration_count": 1,
             "notes": ["safety_alignment_override"],
             "fallback": {
@@ -612,8 +740,8 @@ def run_m22_safety_alignment(state: ACAState) -> None:
             "module": "M22",
         }
         state.fallback = dict(state.result.get("fallback") or {})
-        _set_output(state, "M22", state.safety.copy())
-        _append_trace(state, module_id="M22", module_name="SafetyAlignment", tier="tier0_safety", status="blocked", detail="Unsafe output blocked and replaced with safe fallback.")
+        _set_output(state, "M22", M22Output(**state.safety))
+        _append_trace(state, "M22", status="blocked", detail="Unsafe output blocked and replaced with safe fallback.")
         return
 
     state.safety = {
@@ -623,8 +751,8 @@ def run_m22_safety_alignment(state: ACAState) -> None:
         "threat_level": "low" if not state.prompt_injection_detected else "medium",
         "module": "M22",
     }
-    _set_output(state, "M22", state.safety.copy())
-    _append_trace(state, module_id="M22", module_name="SafetyAlignment", tier="tier0_safety", status="pass", detail="Output aligned with safety policy.")
+    _set_output(state, "M22", M22Output(**state.safety))
+    _append_trace(state, "M22", status="pass", detail="Output aligned with safety policy.")
 
 
 def run_m23_interface_layer(state: ACAState) -> None:
@@ -661,8 +789,12 @@ def run_m23_interface_layer(state: ACAState) -> None:
     }
     result["aca_version"] = "4.1"
     result["final_message"] = str(result.get("candidate_response") or "").strip()
-    _set_output(state, "M23", {"response_keys": sorted(result.keys()), "schema_family": "assistant_v1_plus_v2_fields"})
-    result["module_outputs"] = state.module_outputs
+    _set_output(state, "M23", M23Output(response_keys=sorted(result.keys())))
+    result["module_outputs"] = {
+        module_id: payload.as_dict() if isinstance(payload, ACAModuleOutput) else payload
+        for module_id, payload in state.module_outputs.items()
+        if payload is not None
+    }
     state.result = result
-    _append_trace(state, module_id="M23", module_name="InterfaceLayer", tier="tier3_operational", status="pass", detail="Final interface payload normalized.")
+    _append_trace(state, "M23", status="pass", detail="Final interface payload normalized.")
 
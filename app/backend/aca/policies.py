@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import re
-from typing import Dict, List
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
 
 
 _PROMPT_INJECTION_PATTERNS = [
@@ -41,39 +46,205 @@ _UNSAFE_OUTPUT_PATTERNS = [
 	r"steal credentials",
 ]
 
+_SAFE_METADATA_KEYS = frozenset(
+	{"tone_preference", "pacing_preference", "structural_preference", "verbosity_level", "theme", "font_size"}
+)
+
+# One compiled pattern per entry: fused (?:a)|(?:b) alternations lose re's literal-prefix search and measured slower.
+_PROMPT_INJECTION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _PROMPT_INJECTION_PATTERNS)
+_UNTRUSTED_TOOL_OUTPUT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _UNTRUSTED_TOOL_OUTPUT_PATTERNS)
+# Characters a sensitive pattern cannot match without; redaction markers contain neither.
+_AT_SIGN_RE = re.compile("@")
+_DIGIT_RE = re.compile(r"\d")
+_SENSITIVE_TEXT_PREFILTERS: Dict[str, re.Pattern[str] | None] = {
+	"[redacted_email]": _AT_SIGN_RE,
+	"[redacted_ssn]": _DIGIT_RE,
+	"[redacted_card]": _DIGIT_RE,
+	"[redacted_key]": None,
+	"[redacted_phone]": _DIGIT_RE,
+}
+_SENSITIVE_TEXT_RES = tuple(
+	(re.compile(pattern, re.IGNORECASE), replacement, _SENSITIVE_TEXT_PREFILTERS[replacement])
+	for pattern, replacement in _SENSITIVE_TEXT_PATTERNS
+)
+_FORBIDDEN_MEMORY_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _FORBIDDEN_MEMORY_PATTERNS)
+_UNSAFE_OUTPUT_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in _UNSAFE_OUTPUT_PATTERNS)
+
+# Every ASCII character str.split() treats as whitespace, apart from the space itself.
+_ASCII_SPACE_CONTROLS = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f"
+
+_HS_INJECTION, _HS_UNTRUSTED, _HS_SENSITIVE, _HS_FORBIDDEN, _HS_UNSAFE = range(5)
+_HS_FAMILIES: Tuple[Tuple[int, List[str]], ...] = (
+	(_HS_INJECTION, _PROMPT_INJECTION_PATTERNS),
+	(_HS_UNTRUSTED, _UNTRUSTED_TOOL_OUTPUT_PATTERNS),
+	(_HS_SENSITIVE, [pattern for pattern, _replacement in _SENSITIVE_TEXT_PATTERNS]),
+	(_HS_FORBIDDEN, _FORBIDDEN_MEMORY_PATTERNS),
+	(_HS_UNSAFE, _UNSAFE_OUTPUT_PATTERNS),
+)
+_HS_PATTERN_FAMILIES = tuple(family for family, patterns in _HS_FAMILIES for _pattern in patterns)
+_HS_FAMILY_IDS: Dict[int, Tuple[int, ...]] = {
+	family: tuple(pattern_id for pattern_id, owner in enumerate(_HS_PATTERN_FAMILIES) if owner == family)
+	for family, _patterns in _HS_FAMILIES
+}
+
+
+_HS_CACHE_DIR = Path.home() / ".cache" / "rtc-app"
+_HS_CACHE_FORMAT = b"v1"
+
+
+def _hyperscan_cache_path(expressions: List[bytes], version: str) -> Path:
+	key = hashlib.sha256(b"\0".join([_HS_CACHE_FORMAT, version.encode("ascii"), *expressions])).hexdigest()
+	return _HS_CACHE_DIR / f"policies-{key}.hsdb"
+
+
+def _write_hyperscan_cache(path: Path, payload: bytes) -> None:
+	try:
+		path.parent.mkdir(parents=True, exist_ok=True)
+		with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False) as handle:
+			handle.write(payload)
+		os.replace(handle.name, path)
+	except OSError:
+		return
+
+
+def _compile_or_load_db() -> Any:
+	try:
+		import hyperscan
+	except ImportError:
+		return None
+	expressions = [pattern.encode("ascii") for _family, patterns in _HS_FAMILIES for pattern in patterns]
+	cache_path = _hyperscan_cache_path(expressions, hyperscan.__version__)
+	try:
+		database = hyperscan.loadb(cache_path.read_bytes(), hyperscan.HS_MODE_BLOCK)
+		# Deserialized databases come without scratch space.
+		database.scratch = hyperscan.Scratch(database)
+		return database
+	except (OSError, hyperscan.error):
+		pass
+	database = hyperscan.Database()
+	try:
+		database.compile(
+			expressions=expressions,
+			ids=list(range(len(expressions))),
+			elements=len(expressions),
+			flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(expressions),
+		)
+	except hyperscan.error:
+		return None
+	_write_hyperscan_cache(cache_path, hyperscan.dumpb(database))
+	return database
+
+
+# Optional accelerator: one Hyperscan pass reports every pattern family; the re tuples above stay authoritative.
+_HS_DATABASE = _compile_or_load_db()
+# Scratch space is single-user; each worker thread clones its own on first scan.
+_HS_LOCAL = threading.local()
+
+
+def _on_hs_match(pattern_id: int, _start: int, _end: int, _flags: int, matched: Set[int]) -> None:
+	matched.add(pattern_id)
+
+
+def _hs_scratch() -> Any:
+	database, scratch = getattr(_HS_LOCAL, "scratch", (None, None))
+	if database is not _HS_DATABASE:
+		scratch = _HS_DATABASE.scratch.clone()
+		_HS_LOCAL.scratch = (_HS_DATABASE, scratch)
+	return scratch
+
+
+def _scan(text: str) -> Set[int] | None:
+	# Non-ASCII text keeps the re path so Unicode case folding, \d and \b behave exactly as before.
+	if _HS_DATABASE is None or not text.isascii():
+		return None
+	matched: Set[int] = set()
+	_HS_DATABASE.scan(text.encode("ascii"), match_event_handler=_on_hs_match, context=matched, scratch=_hs_scratch())
+	return matched
+
+
+def _hs_hit(matched: Set[int], family: int) -> bool:
+	return not matched.isdisjoint(_HS_FAMILY_IDS[family])
+
+
+def _collapse_whitespace(text: str) -> str:
+	if (
+		text.isascii()
+		and not any(char in text for char in _ASCII_SPACE_CONTROLS)
+		and "  " not in text
+		and text[:1] != " "
+		and text[-1:] != " "
+	):
+		return text
+	return " ".join(text.split())
+
 
 def detect_prompt_injection(text: str) -> bool:
-	content = text.lower()
-	return any(re.search(pattern, content, re.IGNORECASE) for pattern in _PROMPT_INJECTION_PATTERNS)
+	matched = _scan(text)
+	if matched is not None:
+		return _hs_hit(matched, _HS_INJECTION)
+	return any(pattern.search(text) for pattern in _PROMPT_INJECTION_RES)
 
 
 def detect_untrusted_tool_instruction(text: str) -> bool:
-	content = text.lower()
-	return any(re.search(pattern, content, re.IGNORECASE) for pattern in _UNTRUSTED_TOOL_OUTPUT_PATTERNS)
+	matched = _scan(text)
+	if matched is not None:
+		return _hs_hit(matched, _HS_UNTRUSTED)
+	return any(pattern.search(text) for pattern in _UNTRUSTED_TOOL_OUTPUT_RES)
+
+
+def scan_input_threats(text: str) -> Tuple[bool, bool]:
+	matched = _scan(text)
+	if matched is not None:
+		return _hs_hit(matched, _HS_INJECTION), _hs_hit(matched, _HS_UNTRUSTED)
+	return (
+		any(pattern.search(text) for pattern in _PROMPT_INJECTION_RES),
+		any(pattern.search(text) for pattern in _UNTRUSTED_TOOL_OUTPUT_RES),
+	)
 
 
 def sanitize_memory_text(text: str, *, max_chars: int = 4000) -> str:
 	result = text
-	for pattern, replacement in _SENSITIVE_TEXT_PATTERNS:
-		result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
-	for pattern in _FORBIDDEN_MEMORY_PATTERNS:
-		result = re.sub(pattern, "[redacted_internal]", result, flags=re.IGNORECASE)
-	result = " ".join(result.split()).strip()
+	matched = _scan(text)
+	if matched is None:
+		present = {prefilter: prefilter.search(text) is not None for prefilter in (_AT_SIGN_RE, _DIGIT_RE)}
+		sensitive = [
+			(pattern, replacement)
+			for pattern, replacement, prefilter in _SENSITIVE_TEXT_RES
+			if prefilter is None or present[prefilter]
+		]
+		forbidden = _FORBIDDEN_MEMORY_RES
+	else:
+		# Markers only replace whole \b-delimited spans, so no substitution can create a match for a pattern
+		# the scan did not report; only the reported ones need a pass.
+		sensitive = [
+			(pattern, replacement)
+			for pattern_id, (pattern, replacement, _prefilter) in zip(_HS_FAMILY_IDS[_HS_SENSITIVE], _SENSITIVE_TEXT_RES)
+			if pattern_id in matched
+		]
+		forbidden = tuple(pattern for pattern_id, pattern in zip(_HS_FAMILY_IDS[_HS_FORBIDDEN], _FORBIDDEN_MEMORY_RES) if pattern_id in matched)
+	for pattern, replacement in sensitive:
+		result = pattern.sub(replacement, result)
+	for pattern in forbidden:
+		result = pattern.sub("[redacted_internal]", result)
+	result = _collapse_whitespace(result)
 	if len(result) > max_chars:
 		result = result[: max_chars - 15].rstrip() + "...[truncated]"
 	return result
 
 
 def memory_write_allowed(payload: str) -> bool:
-	text = payload.lower()
-	return not any(re.search(pattern, text, re.IGNORECASE) for pattern in _FORBIDDEN_MEMORY_PATTERNS)
+	matched = _scan(payload)
+	if matched is not None:
+		return not _hs_hit(matched, _HS_FORBIDDEN)
+	return not any(pattern.search(payload) for pattern in _FORBIDDEN_MEMORY_RES)
 
 
 def filter_safe_metadata(metadata: Dict[str, object]) -> Dict[str, object]:
-	allowed = {"tone_preference", "pacing_preference", "structural_preference", "verbosity_level", "theme", "font_size"}
-	return {key: value for key, value in metadata.items() if key in allowed}
+	return {key: value for key, value in metadata.items() if key in _SAFE_METADATA_KEYS}
 
 
 def output_is_safe(text: str) -> bool:
-	content = text.lower()
-	return not any(re.search(pattern, content, re.IGNORECASE) for pattern in _UNSAFE_OUTPUT_PATTERNS)
+	matched = _scan(text)
+	if matched is not None:
+		return not _hs_hit(matched, _HS_UNSAFE)
+	return not any(pattern.search(text) for pattern in _UNSAFE_OUTPUT_RES)
@@ -12,6 +12,7 @@ def run_task_integrity_stub(state: ACAState) -> None:
 			tier="tier3_operational",
 			status="stub",
 			detail="Task Integrity layer is running as a placeholder in this release.",
+			timestamp=state.trace_timestamp,
 		)
 	)
 
@@ -24,6 +25,7 @@ def run_error_coherence_stub(state: ACAState) -> None:
 			tier="tier3_operational",
 			status="stub",
 			detail="Error and Coherence checker is running as a placeholder in this release.",
+			timestamp=state.trace_timestamp,
 		)
 	)
 
@@ -36,6 +38,7 @@ def run_fallback_manager_stub(state: ACAState) -> None:
 			tier="tier3_operational",
 			status="stub",
 			detail="Fallback Manager is running as a placeholder in this release.",
+			timestamp=state.trace_timestamp,
 		)
 	)
 	notes = state.result.get("notes")
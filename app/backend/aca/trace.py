@@ -1,13 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Iterable, List
 
-from app.backend.aca.types import ACATraceEvent, TraceStatus, TraceTier
-
-
-def now_iso() -> str:
-	return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+from app.backend.aca.types import ACATraceBuffer, ACATraceEvent, TraceStatus, TraceTier
+from app.backend.time_utils import now_iso
 
 
 def make_event(
@@ -17,6 +13,7 @@ def make_event(
 	tier: TraceTier,
 	status: TraceStatus,
 	detail: str,
+	timestamp: str | None = None,
 ) -> ACATraceEvent:
 	return ACATraceEvent(
 		module_id=module_id,
@@ -24,10 +21,12 @@ def make_event(
 		tier=tier,
 		status=status,
 		detail=detail,
-		timestamp=now_iso(),
+		timestamp=timestamp or now_iso(),
 	)
 
 
-def serialize_trace(trace_events: Iterable[ACATraceEvent]) -> List[dict]:
+def serialize_trace(trace_events: ACATraceBuffer | Iterable[ACATraceEvent]) -> List[dict]:
+	if isinstance(trace_events, ACATraceBuffer):
+		return trace_events.as_dicts()
 	return [event.as_dict() for event in trace_events]
 
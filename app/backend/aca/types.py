@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Literal
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Literal, Mapping
 
 
 RiskTolerance = Literal["low", "medium", "high"]
@@ -9,8 +10,12 @@ ProviderMode = Literal["auto", "openai", "local"]
 TraceTier = Literal["tier0_safety", "tier1_meta", "tier2_bottleneck", "tier3_operational"]
 TraceStatus = Literal["pass", "adjusted", "fallback", "blocked", "stub"]
 
+ACA_MODULE_IDS = tuple(f"M{index}" for index in range(24))
+# Pre-keyed in pipeline order; copying a same-shape dict clones its key table without rehashing.
+_EMPTY_MODULE_OUTPUTS: Dict[str, Any] = dict.fromkeys(ACA_MODULE_IDS)
 
-@dataclass
+
+@dataclass(slots=True)
 class ACATraceEvent:
 	module_id: str
 	module_name: str
@@ -30,7 +35,52 @@ class ACATraceEvent:
 		}
 
 
-@dataclass
+@dataclass(slots=True)
+class ACATraceBuffer:
+	module_ids: List[str] = field(default_factory=list)
+	module_names: List[str] = field(default_factory=list)
+	tiers: List[TraceTier] = field(default_factory=list)
+	statuses: List[TraceStatus] = field(default_factory=list)
+	details: List[str] = field(default_factory=list)
+	timestamps: List[str] = field(default_factory=list)
+
+	def __len__(self) -> int:
+		return len(self.module_ids)
+
+	def record(self, module_id: str, module_name: str, tier: TraceTier, status: TraceStatus, detail: str, timestamp: str) -> None:
+		self.module_ids.append(module_id)
+		self.module_names.append(module_name)
+		self.tiers.append(tier)
+		self.statuses.append(status)
+		self.details.append(detail)
+		self.timestamps.append(timestamp)
+
+	def append(self, event: ACATraceEvent) -> None:
+		self.record(event.module_id, event.module_name, event.tier, event.status, event.detail, event.timestamp)
+
+	def events(self) -> List[ACATraceEvent]:
+		return [
+			ACATraceEvent(*row)
+			for row in zip(self.module_ids, self.module_names, self.tiers, self.statuses, self.details, self.timestamps)
+		]
+
+	def as_dicts(self) -> List[Dict[str, str]]:
+		return [
+			{
+				"module_id": module_id,
+				"module_name": module_name,
+				"tier": tier,
+				"status": status,
+				"detail": detail,
+				"timestamp": timestamp,
+			}
+			for module_id, module_name, tier, status, detail, timestamp in zip(
+				self.module_ids, self.module_names, self.tiers, self.statuses, self.details, self.timestamps
+			)
+		]
+
+
+@dataclass(slots=True)
 class ACARequest:
 	user_input: str
 	context: str | None
@@ -42,11 +92,205 @@ class ACARequest:
 	trace_enabled: bool = False
 
 
-@dataclass
+class ACAModuleOutput:
+	__slots__ = ()
+	# Output keys that are not valid Python identifiers (e.g. "pass").
+	KEY_ALIASES: ClassVar[Dict[str, str]] = {}
+
+	def as_dict(self) -> Dict[str, Any]:
+		aliases = self.KEY_ALIASES
+		payload: Dict[str, Any] = {}
+		for name in self.__slots__:
+			value = getattr(self, name)
+			# Read-only views of live state are materialized at the response boundary.
+			payload[aliases.get(name, name)] = dict(value) if isinstance(value, MappingProxyType) else value
+		return payload
+
+
+@dataclass(slots=True)
+class M0Output(ACAModuleOutput):
+	prompt_injection_detected: bool
+	untrusted_tool_instruction_detected: bool
+	memory_policy: str = "session_sanitized_only"
+
+
+@dataclass(slots=True)
+class M1Output(ACAModuleOutput):
+	identity_tag: str
+
+
+@dataclass(slots=True)
+class M2Output(ACAModuleOutput):
+	tone_preference: str
+	pacing_preference: str
+	structural_preference: str
+	verbosity_level: int
+
+
+@dataclass(slots=True)
+class M3Output(ACAModuleOutput):
+	risk_tolerance: RiskTolerance
+	safety_locked: bool
+
+
+@dataclass(slots=True)
+class M4Output(ACAModuleOutput):
+	mode: str
+
+
+@dataclass(slots=True)
+class M5Output(ACAModuleOutput):
+	path_type: str
+	input_length: int
+
+
+@dataclass(slots=True)
+class M6Output(ACAModuleOutput):
+	weights: Mapping[str, float]
+	safety_floor: float
+
+
+@dataclass(slots=True)
+class M7Output(ACAModuleOutput):
+	emotional_load: str
+	tone: str
+
+
+@dataclass(slots=True)
+class M8Output(ACAModuleOutput):
+	complexity_level: str
+	signal: str
+	tier: str
+
+
+@dataclass(slots=True)
+class M9Output(ACAModuleOutput):
+	trimmed: bool
+	context_chars: int
+
+
+@dataclass(slots=True)
+class M10Output(ACAModuleOutput):
+	task_type: str
+	objective: str
+	constraints: List[str]
+	acceptance_checks: List[str]
+	steps: List[str]
+
+
+@dataclass(slots=True)
+class M11Output(ACAModuleOutput):
+	branches: List[Dict[str, Any]]
+	branch_count: int
+	pruning_rule: str = "prune only contradictory branches"
+
+
+@dataclass(slots=True)
+class M12Output(ACAModuleOutput):
+	outline: List[Dict[str, Any]]
+	section_count: int
+
+
+@dataclass(slots=True)
+class M13Output(ACAModuleOutput):
+	contradictions: List[str]
+	context_sanitized: bool
+
+
+@dataclass(slots=True)
+class M14Output(ACAModuleOutput):
+	provider_executed: bool
+	provider_mode: ProviderMode
+	model: str
+	result_mode: str
+
+
+@dataclass(slots=True)
+class M14SkippedOutput(ACAModuleOutput):
+	provider_executed: bool
+	provider_mode: ProviderMode
+	model: str
+	reason: str
+
+
+@dataclass(slots=True)
+class M15Output(ACAModuleOutput):
+	weights: Dict[str, float]
+	raw_scores: Dict[str, float]
+	weighted_score: float
+	safety_floor: float
+
+
+@dataclass(slots=True)
+class M16Output(ACAModuleOutput):
+	path_type: str
+	budget: int
+	iterations_used: int
+	modifications: List[str]
+
+
+@dataclass(slots=True)
+class M17Output(ACAModuleOutput):
+	strategy_cascade: List[str]
+	strategy_used: str
+	plan_length: int
+
+
+@dataclass(slots=True)
+class M18Output(ACAModuleOutput):
+	KEY_ALIASES: ClassVar[Dict[str, str]] = {"passed": "pass"}
+
+	passed: bool
+	failures: List[str]
+	checks: Dict[str, bool]
+
+
+@dataclass(slots=True)
+class M19Output(ACAModuleOutput):
+	KEY_ALIASES: ClassVar[Dict[str, str]] = {"passed": "pass"}
+
+	passed: bool
+	issues: List[str]
+	quality_score: float
+
+
+@dataclass(slots=True)
+class M20Output(ACAModuleOutput):
+	triggered: bool
+	reason_code: str
+	strategy: str
+	notes: List[str]
+
+
+@dataclass(slots=True)
+class M21Output(ACAModuleOutput):
+	formatted: bool
+	candidate_chars: int
+	mode: Any
+
+
+@dataclass(slots=True)
+class M22Output(ACAModuleOutput):
+	input_safe: bool
+	output_safe: bool
+	blocked: bool
+	threat_level: str
+	module: str = "M22"
+
+
+@dataclass(slots=True)
+class M23Output(ACAModuleOutput):
+	response_keys: List[str]
+	schema_family: str = "assistant_v1_plus_v2_fields"
+
+
+@dataclass(slots=True)
 class ACAState:
 	request: ACARequest
 	working_input: str = ""
 	working_context: str | None = None
+	working_input_lower: str = ""
+	working_context_lower: str = ""
 	identity_tag: str = "GENERIC"
 	preferences: Dict[str, Any] = field(default_factory=dict)
 	meta_policy: Dict[str, Any] = field(default_factory=dict)
@@ -60,11 +304,15 @@ class ACAState:
 	decision_tree: List[Dict[str, Any]] = field(default_factory=list)
 	outline: List[Dict[str, Any]] = field(default_factory=list)
 	decision_graph: List[Dict[str, Any]] = field(default_factory=list)
-	module_outputs: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+	module_outputs: Dict[str, ACAModuleOutput | Dict[str, Any] | None] = field(default_factory=_EMPTY_MODULE_OUTPUTS.copy)
 	prompt_injection_detected: bool = False
 	untrusted_tool_instruction_detected: bool = False
 	quality_score: float = 0.0
 	safety: Dict[str, Any] = field(default_factory=dict)
 	fallback: Dict[str, Any] = field(default_factory=dict)
 	result: Dict[str, object] = field(default_factory=dict)
-	trace: List[ACATraceEvent] = field(default_factory=list)
+	trace: ACATraceBuffer = field(default_factory=ACATraceBuffer)
+	trace_timestamp: str = ""
+	plan_lower: List[str] = field(default_factory=list)
+	plan_lower_source: List[Any] | None = None
+	plan_normalized: bool = False
@@ -1,34 +1,46 @@
 ﻿from __future__ import annotations
 
+import asyncio
+import locale
 import subprocess
 import sys
-from datetime import datetime, timezone
-from typing import Dict
+from typing import Dict, List
 
+from app.backend.time_utils import now_iso
 
-def _now_iso() -> str:
-	return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+_SYNC_TIMEOUT_S = 120
+_SYNC_TIMEOUT_MESSAGE = f"sync process timed out after {_SYNC_TIMEOUT_S} seconds"
+
+
+def _sync_command() -> List[str]:
+	return [
+		sys.executable,
+		"scripts/sync_oversight_trace.py",
+		"--rfc",
+		"docs/oversight_assistant_rfc.md",
+		"--matrix",
+		"docs/requirements_trace_matrix.md",
+		"--playbook",
+		"docs/patch_playbook.md",
+		"--handoff",
+		"SESSION_HANDOFF.md",
+	]
+
+
+def _decode_output(data: bytes) -> str:
+	# Same decoding as subprocess.run(text=True): locale encoding with universal newlines.
+	return data.decode(locale.getpreferredencoding(False)).replace("\r\n", "\n").replace("\r", "\n")
 
 
 def run_sync_process() -> Dict[str, str | int]:
-	started_at = _now_iso()
+	started_at = now_iso()
 	try:
 		proc = subprocess.run(
-			[
-				sys.executable,
-				"scripts/sync_oversight_trace.py",
-				"--rfc",
-				"docs/oversight_assistant_rfc.md",
-				"--matrix",
-				"docs/requirements_trace_matrix.md",
-				"--playbook",
-				"docs/patch_playbook.md",
-				"--handoff",
-				"SESSION_HANDOFF.md",
-			],
+			_sync_command(),
 			capture_output=True,
 			text=True,
-			timeout=120,
+			timeout=_SYNC_TIMEOUT_S,
 		)
 		exit_code = proc.returncode
 		stdout = proc.stdout
@@ -36,8 +48,42 @@ def run_sync_process() -> Dict[str, str | int]:
 	except subprocess.TimeoutExpired:
 		exit_code = 124
 		stdout = ""
-		stderr = "sync process timed out after 120 seconds"
-	ended_at = _now_iso()
+		stderr = _SYNC_TIMEOUT_MESSAGE
+	ended_at = now_iso()
+	return {
+		"exit_code": exit_code,
+		"stdout": stdout,
+		"stderr": stderr,
+		"started_at": started_at,
+		"ended_at": ended_at,
+	}
+
+
+async def run_sync_process_async() -> Dict[str, str | int]:
+	started_at = now_iso()
+	proc = await asyncio.create_subprocess_exec(
+		*_sync_command(),
+		stdout=asyncio.subprocess.PIPE,
+		stderr=asyncio.subprocess.PIPE,
+	)
+	try:
+		raw_stdout, raw_stderr = await asyncio.wait_for(proc.communicate(), timeout=_SYNC_TIMEOUT_S)
+		exit_code = proc.returncode
+		stdout = _decode_output(raw_stdout)
+		stderr = _decode_output(raw_stderr)
+	except asyncio.TimeoutError:
+		exit_code = 124
+		stdout = ""
+		stderr = _SYNC_TIMEOUT_MESSAGE
+	finally:
+		# Reached on timeout and on cancellation (client disconnect, shutdown): never leave the script running.
+		if proc.returncode is None:
+			try:
+				proc.kill()
+			except ProcessLookupError:
+				pass
+			await proc.wait()
+	ended_at = now_iso()
 	return {
 		"exit_code": exit_code,
 		"stdout": stdout,
@@ -1,18 +1,14 @@
 ﻿from __future__ import annotations
 
 import sqlite3
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from app.backend import constants
+from app.backend.time_utils import now_iso
 from app.backend.validators.types import RunRecords
 
 
-def _now_iso() -> str:
-	return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-
 def _get_db_path(db_path: Optional[str]) -> str:
 	if db_path:
 		return db_path
@@ -126,7 +122,7 @@ def upsert_finding_state(
 ) -> Dict[str, Any]:
 	init_db(db_path)
 	path = _get_db_path(db_path)
-	updated_at = _now_iso()
+	updated_at = now_iso()
 	conn = _connect(path)
 	try:
 		conn.execute(
@@ -186,6 +182,16 @@ def list_finding_states(
 		conn.close()
 
 
+def fetch_finding_status_map(db_path: Optional[str] = None) -> Dict[str, str]:
+	init_db(db_path)
+	path = _get_db_path(db_path)
+	conn = _connect(path)
+	try:
+		return dict(conn.execute("SELECT finding_id, status FROM finding_state").fetchall())
+	finally:
+		conn.close()
+
+
 def get_finding_states(db_path: Optional[str] = None) -> List[Dict[str, Any]]:
 	return list_finding_states(db_path=db_path)
 
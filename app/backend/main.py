@@ -33,7 +33,8 @@ def create_app() -> FastAPI:
 
 def _register_middleware(app: FastAPI) -> None:
 	app.add_middleware(RequestContextMiddleware)
-	app.add_middleware(GZipMiddleware, minimum_size=1024)
+	# zlib's default level; 9 costs ~30% more CPU on envelope-sized JSON for <1% smaller bodies.
+	app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 	app.add_middleware(
 		CORSMiddleware,
 		allow_origins=constants.DEFAULT_CORS_ALLOW_ORIGINS,
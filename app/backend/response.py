@@ -1,13 +1,10 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
 from fastapi import Request
 
-
-def now_iso() -> str:
-	return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+from app.backend.time_utils import now_iso
 
 
 def _request_id(request: Optional[Request]) -> Optional[str]:
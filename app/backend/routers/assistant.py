@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
 import json
-import uuid
+import time
 from collections.abc import Iterator
+from secrets import token_hex
+from typing import Tuple
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 
 from app.backend.response import success_response
@@ -19,28 +22,81 @@ from app.backend.services import assistant_service
 
 
 router = APIRouter(prefix="/api/assistant", tags=["assistant"])
+# json.dumps builds a fresh JSONEncoder whenever a keyword like ensure_ascii is passed; reuse one.
+_SSE_JSON_ENCODE = json.JSONEncoder(ensure_ascii=False).encode
+_SSE_PREFIXES = {
+	event: f"event: {event}\ndata: ".encode("utf-8")
+	for event in ("meta", "checkpoint", "trace", "delta", "done", "error", "message")
+}
+_SSE_FLUSH_BYTES = 4096
+_SSE_FLUSH_INTERVAL_S = 0.02
+_SSE_HEADERS = {
+	"Cache-Control": "no-cache",
+	"Connection": "keep-alive",
+	"X-Accel-Buffering": "no",
+}
+
+
+def _assistant_headers(request: Request, payload_trace: bool) -> Tuple[str, bool]:
+	# Each Starlette header lookup scans the raw header list; skip the trace one when the payload already asks.
+	headers = request.headers
+	session_id = headers.get("x-session-id", "").strip() or token_hex(16)
+	trace_enabled = payload_trace or headers.get("x-aca-trace", "").strip() == "1"
+	return session_id, trace_enabled
+
+
+def _catalog_etag(data: dict) -> str:
+	# Derived from the catalog only; the envelope's generated_at and request_id change on every call.
+	body = json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+	return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+	for candidate in if_none_match.split(","):
+		candidate = candidate.strip()
+		if candidate == "*" or candidate.removeprefix("W/") == etag:
+			return True
+	return False
+
+
+def _encode_sse(event: str, data: dict) -> bytes:
+	prefix = _SSE_PREFIXES.get(event) or f"event: {event}\ndata: ".encode("utf-8")
+	return prefix + _SSE_JSON_ENCODE(data).encode("utf-8") + b"\n\n"
+
+
+_STREAM_FAILED_FRAME = _encode_sse(
+	"error",
+	{"code": "assistant_provider_error", "message": "Assistant stream failed."},
+)
 
 
-def _session_id_from_request(request: Request) -> str:
-	session_id = request.headers.get("X-Session-ID", "").strip()
-	return session_id or uuid.uuid4().hex
-
-
-def _trace_enabled(request: Request) -> bool:
-	return request.headers.get("X-ACA-Trace", "").strip() == "1"
-
-
-def _trace_requested(request: Request, payload_trace: bool) -> bool:
-	return _trace_enabled(request) or payload_trace
-
-
-def _encode_sse(event: str, data: dict) -> str:
-	payload = json.dumps(data, ensure_ascii=False)
-	return f"event: {event}\ndata: {payload}\n\n"
+def _sse_frames(events: Iterator[assistant_service.StreamEvent]) -> Iterator[bytes]:
+	# The service streams are generators, so their errors surface while iterating here.
+	# Each next() on a sync StreamingResponse body is a threadpool hop, so frames are coalesced;
+	# meta is flushed on its own because it goes out before the pipeline runs.
+	buffer = bytearray()
+	last_flush = time.monotonic()
+	try:
+		for event_name, data in events:
+			buffer += _encode_sse(event_name, data)
+			now = time.monotonic()
+			if event_name == "meta" or len(buffer) >= _SSE_FLUSH_BYTES or now - last_flush >= _SSE_FLUSH_INTERVAL_S:
+				yield bytes(buffer)
+				buffer.clear()
+				last_flush = now
+	except assistant_service.AssistantServiceError as exc:
+		buffer += _encode_sse("error", {"code": exc.code, "message": exc.message})
+	except ValueError as exc:
+		buffer += _encode_sse("error", {"code": "assistant_bad_request", "message": str(exc)})
+	except Exception:
+		buffer += _STREAM_FAILED_FRAME
+	if buffer:
+		yield bytes(buffer)
 
 
+# Only reads env-backed settings, so it runs on the event loop instead of the threadpool.
 @router.get("/models", response_model=ApiEnvelope)
-def models(request: Request):
+async def models(request: Request, response: Response):
 	try:
 		catalog = assistant_service.list_models()
 	except assistant_service.AssistantServiceError as exc:
@@ -48,23 +104,25 @@ def models(request: Request):
 			status_code=exc.status_code,
 			detail={"code": exc.code, "message": exc.message},
 		) from exc
-	return success_response(
-		request=request,
-		data={
-			"models": catalog["models"],
-			"default_model": catalog["default_model"],
-			"provider_mode": catalog["provider_mode"],
-			"effective_provider_mode": catalog.get("effective_provider_mode", catalog["provider_mode"]),
-			"provider_ready": catalog.get("provider_ready", True),
-			"provider_warnings": catalog.get("provider_warnings", []),
-		},
-	)
+	data = {
+		"models": catalog["models"],
+		"default_model": catalog["default_model"],
+		"provider_mode": catalog["provider_mode"],
+		"effective_provider_mode": catalog.get("effective_provider_mode", catalog["provider_mode"]),
+		"provider_ready": catalog.get("provider_ready", True),
+		"provider_warnings": catalog.get("provider_warnings", []),
+	}
+	etag = _catalog_etag(data)
+	headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+	if _etag_matches(request.headers.get("If-None-Match", ""), etag):
+		return Response(status_code=304, headers=headers)
+	response.headers.update(headers)
+	return success_response(request=request, data=data)
 
 
 @router.post("/respond", response_model=ApiEnvelope)
 def respond(request: Request, payload: AssistantRespondRequest):
-	session_id = _session_id_from_request(request)
-	trace_enabled = _trace_requested(request, False)
+	session_id, trace_enabled = _assistant_headers(request, False)
 	try:
 		result, trace = assistant_service.respond_with_trace(
 			user_input=payload.user_input,
@@ -91,8 +149,7 @@ def respond(request: Request, payload: AssistantRespondRequest):
 
 @router.post("/respond-v2", response_model=ApiEnvelope)
 def respond_v2(request: Request, payload: AssistantRespondV2Request):
-	session_id = _session_id_from_request(request)
-	trace_enabled = _trace_requested(request, payload.trace)
+	session_id, trace_enabled = _assistant_headers(request, payload.trace)
 	try:
 		result, _trace = assistant_service.respond_v2_with_trace(
 			user_input=payload.user_input,
@@ -115,83 +172,39 @@ def respond_v2(request: Request, payload: AssistantRespondV2Request):
 
 @router.post("/stream")
 def stream(request: Request, payload: AssistantStreamRequest):
-	session_id = _session_id_from_request(request)
-	trace_enabled = _trace_requested(request, False)
-
-	def generate() -> Iterator[str]:
-		try:
-			for event in assistant_service.stream_respond(
-				user_input=payload.user_input,
-				context=payload.context,
-				risk_tolerance=payload.risk_tolerance,
-				max_questions=payload.max_questions,
-				model=payload.model,
-				session_id=session_id,
-				trace_enabled=trace_enabled,
-			):
-				event_name = str(event.get("event") or "message")
-				data = event.get("data")
-				if not isinstance(data, dict):
-					data = {"value": data}
-				yield _encode_sse(event_name, data)
-		except assistant_service.AssistantServiceError as exc:
-			yield _encode_sse("error", {"code": exc.code, "message": exc.message})
-		except ValueError as exc:
-			yield _encode_sse("error", {"code": "assistant_bad_request", "message": str(exc)})
-		except Exception:
-			yield _encode_sse(
-				"error",
-				{"code": "assistant_provider_error", "message": "Assistant stream failed."},
-			)
-
+	session_id, trace_enabled = _assistant_headers(request, False)
+
+	events = assistant_service.stream_respond(
+		user_input=payload.user_input,
+		context=payload.context,
+		risk_tolerance=payload.risk_tolerance,
+		max_questions=payload.max_questions,
+		model=payload.model,
+		session_id=session_id,
+		trace_enabled=trace_enabled,
+	)
 	return StreamingResponse(
-		generate(),
+		_sse_frames(events),
 		media_type="text/event-stream",
-		headers={
-			"Cache-Control": "no-cache",
-			"Connection": "keep-alive",
-			"X-Accel-Buffering": "no",
-		},
+		headers=_SSE_HEADERS,
 	)
 
 
 @router.post("/stream-v2")
 def stream_v2(request: Request, payload: AssistantStreamV2Request):
-	session_id = _session_id_from_request(request)
-	trace_enabled = _trace_requested(request, payload.trace)
-
-	def generate() -> Iterator[str]:
-		try:
-			for event in assistant_service.stream_v2(
-				user_input=payload.user_input,
-				context=payload.context,
-				risk_tolerance=payload.risk_tolerance,
-				max_questions=payload.max_questions,
-				model=payload.model,
-				session_id=session_id,
-				trace_enabled=trace_enabled,
-			):
-				event_name = str(event.get("event") or "message")
-				data = event.get("data")
-				if not isinstance(data, dict):
-					data = {"value": data}
-				yield _encode_sse(event_name, data)
-		except assistant_service.AssistantServiceError as exc:
-			yield _encode_sse("error", {"code": exc.code, "message": exc.message})
-		except ValueError as exc:
-			yield _encode_sse("error", {"code": "assistant_bad_request", "message": str(exc)})
-		except Exception:
-			yield _encode_sse(
-				"error",
-				{"code": "assistant_provider_error", "message": "Assistant stream failed."},
-			)
-
+	session_id, trace_enabled = _assistant_headers(request, payload.trace)
+
+	events = assistant_service.stream_v2(
+		user_input=payload.user_input,
+		context=payload.context,
+		risk_tolerance=payload.risk_tolerance,
+		max_questions=payload.max_questions,
+		model=payload.model,
+		session_id=session_id,
+		trace_enabled=trace_enabled,
+	)
 	return StreamingResponse(
-		generate(),
+		_sse_frames(events),
 		media_type="text/event-stream",
-		headers={
-			"Cache-Control": "no-cache",
-			"Connection": "keep-alive",
-			"X-Accel-Buffering": "no",
-		},
+		headers=_SSE_HEADERS,
 	)
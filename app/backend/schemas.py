@@ -35,7 +35,7 @@ class FindingStateUpdate(BaseModel):
 
 
 class AssistantRespondRequest(BaseModel):
-	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
 	user_input: str = Field(..., min_length=1, description="Primary user request.")
 	context: Optional[str] = Field(default=None, description="Optional supporting context.")
@@ -45,7 +45,7 @@ class AssistantRespondRequest(BaseModel):
 
 
 class AssistantStreamRequest(BaseModel):
-	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
 	user_input: str = Field(..., min_length=1, description="Primary user request.")
 	context: Optional[str] = Field(default=None, description="Optional supporting context.")
@@ -55,7 +55,7 @@ class AssistantStreamRequest(BaseModel):
 
 
 class AssistantRespondV2Request(BaseModel):
-	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
 	user_input: str = Field(..., min_length=1, description="Primary user request.")
 	context: Optional[str] = Field(default=None, description="Optional supporting context.")
@@ -66,7 +66,7 @@ class AssistantRespondV2Request(BaseModel):
 
 
 class AssistantStreamV2Request(BaseModel):
-	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+	model_config = ConfigDict(extra="forbid", str_strip_whitespace=True, frozen=True)
 
 	user_input: str = Field(..., min_length=1, description="Primary user request.")
 	context: Optional[str] = Field(default=None, description="Optional supporting context.")
@@ -1,9 +1,14 @@
 ﻿from __future__ import annotations
 
 import hashlib
+import os
 import re
-from collections import defaultdict
-from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+from collections import Counter, OrderedDict, defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
+from threading import Lock
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
 
 from app.backend import constants
 from app.backend.adapters import sqlite_adapter
@@ -14,8 +19,34 @@ from app.backend.validators.types import FindingInfo, RequirementRow, ValidatorC
 
 
 _READY_FOR_VALIDATION = "ready_for_validation"
+_UNSTARTED = "unstarted"
 _SECTION_RE = re.compile(r"^RFC\s+([0-9]+(?:\.[0-9]+)*)\s*:L\d+$", re.IGNORECASE)
 _SEVERITY_SCORE = {"MUST": 3, "SHALL": 3, "SHOULD": 2, "MAY": 1}
+_TRIAGE_STATUSES = frozenset({"gap", "partial"})
+# Decorate-sort-undecorate on (priority key, finding) pairs; the C itemgetter never compares findings.
+_PRIORITY = itemgetter(0)
+# Fixed card lists are shared read-only tuples; JSON encodes them exactly like lists.
+_FINDING_LINKS = ("docs/patch_playbook.md", "docs/requirements_trace_matrix.md", "SESSION_HANDOFF.md")
+_FINDING_LINKS_WITH_ROWS = (
+    "docs/patch_playbook.md",
+    "docs/requirements_trace_matrix.md",
+    "docs/oversight_assistant_rfc.md",
+)
+_TRIAGE_STEPS = (
+    "Review all F-016 rows for the section and group by shared root cause.",
+    "Create concrete patches and move affected findings to in_progress.",
+)
+_TRIAGE_COMMANDS = (
+    "rg \"F-016\" docs/requirements_trace_matrix.md",
+    "python -m unittest tests/test_validator_fixtures.py",
+)
+_TRIAGE_LINKS = ("docs/requirements_trace_matrix.md", "docs/patch_playbook.md")
+_PARSE_CACHE_SIZE = 16
+# (parser, absolute path, mtime_ns, size) -> parsed result; callers treat the results as read-only.
+_PARSE_CACHE: "OrderedDict[Tuple[Callable[[str], Any], str, int, int], Any]" = OrderedDict()
+_PARSE_CACHE_LOCK = Lock()
+
+_T = TypeVar("_T")
 
 _REPAIR_ACTIONS = {
     "toolchain_ok": {
@@ -56,9 +87,25 @@ _REPAIR_ACTIONS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def _action_id(seed: str) -> str:
-    digest = hashlib.sha256(seed.encode("utf-8")).hexdigest()
-    return f"act_{digest[:12]}"
+    # Hex of the first 6 digest bytes == the first 12 hex chars, without formatting all 32 bytes.
+    return "act_" + hashlib.sha256(seed.encode("utf-8")).digest()[:6].hex()
+
+
+def _cached_parse(parser: Callable[[str], _T], path: str) -> _T:
+    stat = os.stat(path)
+    key = (parser, os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _PARSE_CACHE_LOCK:
+        if key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(key)
+            return _PARSE_CACHE[key]
+    parsed = parser(path)
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = parsed
+        while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return parsed
 
 
 def _build_action(
@@ -67,13 +114,12 @@ def _build_action(
     target: str,
     title: str,
     why_now: str,
-    steps: List[str],
-    commands: List[str],
-    links: List[str],
+    steps: Sequence[str],
+    commands: Sequence[str],
+    links: Sequence[str],
 ) -> Dict[str, object]:
-    seed = f"{tier}:{action_type}:{target}:{title}"
     return {
-        "action_id": _action_id(seed),
+        "action_id": _action_id(f"{tier}:{action_type}:{target}:{title}"),
         "tier": tier,
         "type": action_type,
         "target": target,
@@ -85,13 +131,63 @@ def _build_action(
     }
 
 
-def _load_state_status(db_path: str) -> Dict[str, str]:
+# Specialized forms of _build_action for the two per-finding/per-invariant card shapes.
+def _finding_action(
+    action_id: str,
+    tier: int,
+    target: str,
+    title: str,
+    why_now: str,
+    steps: Sequence[str],
+    commands: Sequence[str],
+    links: Sequence[str],
+) -> Dict[str, object]:
     return {
-        row["finding_id"]: row["status"]
-        for row in sqlite_adapter.list_finding_states(db_path=db_path)
+        "action_id": action_id,
+        "tier": tier,
+        "type": "resolve_blocker",
+        "target": target,
+        "title": title,
+        "why_now": why_now,
+        "steps": steps,
+        "commands": commands,
+        "links": links,
     }
 
 
+# The repair card title is part of its action id seed; both come from here so ids stay stable.
+_REPAIR_TITLE = "Repair invariant: {}"
+
+
+def _repair_seed(invariant_id: str) -> str:
+    return f"3:repair_invariant:{invariant_id}:{_REPAIR_TITLE.format(invariant_id)}"
+
+
+def _repair_action(
+    action_id: str,
+    target: str,
+    why_now: str,
+    steps: Sequence[str],
+    commands: Sequence[str],
+    links: Sequence[str],
+) -> Dict[str, object]:
+    return {
+        "action_id": action_id,
+        "tier": 3,
+        "type": "repair_invariant",
+        "target": target,
+        "title": _REPAIR_TITLE.format(target),
+        "why_now": why_now,
+        "steps": steps,
+        "commands": commands,
+        "links": links,
+    }
+
+
+def _load_state_status(db_path: str) -> Dict[str, str]:
+    return sqlite_adapter.fetch_finding_status_map(db_path=db_path)
+
+
 def _resolve_runtime_paths(ctx: Optional[ValidatorContext]) -> Tuple[str, str, str, str]:
     if ctx is None:
         return (
@@ -108,65 +204,77 @@ def _resolve_runtime_paths(ctx: Optional[ValidatorContext]) -> Tuple[str, str, s
     )
 
 
-def _group_rows_by_finding(rows: Sequence[RequirementRow]) -> Dict[str, List[RequirementRow]]:
+@dataclass(frozen=True)
+class _FindingRowIndex:
+    rows: Dict[str, List[RequirementRow]]
+    req_ids: Dict[str, Set[str]]
+    severity: Dict[str, int]
+
+
+def _index_rows_by_finding(
+    rows: Sequence[RequirementRow],
+    normative_by_source: Mapping[str, str],
+) -> _FindingRowIndex:
     grouped: Dict[str, List[RequirementRow]] = defaultdict(list)
+    req_ids: Dict[str, Set[str]] = defaultdict(set)
+    severity: Dict[str, int] = {}
     for row in rows:
+        rank = _SEVERITY_SCORE.get(normative_by_source.get(row.source_ref, ""), 0)
         for finding_id in row.findings:
             grouped[finding_id].append(row)
-    return grouped
+            req_ids[finding_id].add(row.req_id)
+            if rank > severity.get(finding_id, 0):
+                severity[finding_id] = rank
+    return _FindingRowIndex(rows=grouped, req_ids=req_ids, severity=severity)
 
 
-def _impact_count(finding: FindingInfo, finding_rows: Mapping[str, Sequence[RequirementRow]]) -> int:
-    req_ids = set(finding.impacted_req_ids)
-    for row in finding_rows.get(finding.finding_id, []):
-        req_ids.add(row.req_id)
-    return len(req_ids)
+def _impact_count(finding: FindingInfo, row_index: _FindingRowIndex) -> int:
+    row_req_ids = row_index.req_ids.get(finding.finding_id)
+    if not row_req_ids:
+        return len(set(finding.impacted_req_ids))
+    return len(row_req_ids.union(finding.impacted_req_ids))
 
 
-def _severity_rank(
-    finding: FindingInfo,
-    finding_rows: Mapping[str, Sequence[RequirementRow]],
-    normative_by_source: Mapping[str, str],
-) -> int:
-    max_rank = 0
-    for row in finding_rows.get(finding.finding_id, []):
-        rank = _SEVERITY_SCORE.get(normative_by_source.get(row.source_ref, ""), 0)
-        max_rank = max(max_rank, rank)
-    return max_rank
+def _severity_rank(finding: FindingInfo, row_index: _FindingRowIndex) -> int:
+    return row_index.severity.get(finding.finding_id, 0)
+
+
+def _reverse_dependencies(findings_by_id: Mapping[str, FindingInfo]) -> Dict[str, List[FindingInfo]]:
+    dependents: Dict[str, List[FindingInfo]] = defaultdict(list)
+    for finding in findings_by_id.values():
+        for dep in dict.fromkeys(finding.dependencies):
+            dependents[dep].append(finding)
+    return dependents
 
 
 def _dependency_unblock_count(
     target_id: str,
-    findings_by_id: Mapping[str, FindingInfo],
+    dependents: Mapping[str, Sequence[FindingInfo]],
     status_by_finding: Mapping[str, str],
 ) -> int:
     count = 0
-    for finding in findings_by_id.values():
-        if target_id not in finding.dependencies:
-            continue
-        remaining = [dep for dep in finding.dependencies if dep != target_id]
-        if all(status_by_finding.get(dep, "unstarted") == _READY_FOR_VALIDATION for dep in remaining):
+    for finding in dependents.get(target_id, ()):
+        if all(
+            status_by_finding.get(dep, _UNSTARTED) == _READY_FOR_VALIDATION
+            for dep in finding.dependencies
+            if dep != target_id
+        ):
             count += 1
     return count
 
 
 def _finding_priority_key(
     finding: FindingInfo,
-    findings_by_id: Mapping[str, FindingInfo],
-    status_by_finding: Mapping[str, str],
-    finding_rows: Mapping[str, Sequence[RequirementRow]],
-    normative_by_source: Mapping[str, str],
+    unblock_by_finding: Mapping[str, int],
+    row_index: _FindingRowIndex,
 ) -> Tuple[int, int, int, str]:
-    dependency_unblock = _dependency_unblock_count(
-        finding.finding_id,
-        findings_by_id,
-        status_by_finding,
-    )
-    impact = _impact_count(finding, finding_rows)
-    severity = _severity_rank(finding, finding_rows, normative_by_source)
+    dependency_unblock = unblock_by_finding[finding.finding_id]
+    impact = _impact_count(finding, row_index)
+    severity = _severity_rank(finding, row_index)
     return (-dependency_unblock, -impact, -severity, finding.finding_id)
 
 
+@lru_cache(maxsize=4096)
 def _extract_section(source_ref: str) -> str:
     match = _SECTION_RE.match(source_ref.strip())
     if not match:
@@ -192,22 +300,13 @@ def _finding_card(
         f"{finding.finding_id} is {status}; impacts {impact_count} requirements, "
         f"unblocks {dependency_unblock} dependent findings."
     )
-    links = [
-        "docs/patch_playbook.md",
-        "docs/requirements_trace_matrix.md",
-        "SESSION_HANDOFF.md",
-    ]
-    if finding_rows.get(finding.finding_id):
-        links = [
-            "docs/patch_playbook.md",
-            "docs/requirements_trace_matrix.md",
-            "docs/oversight_assistant_rfc.md",
-        ]
-    return _build_action(
+    links = _FINDING_LINKS_WITH_ROWS if finding_rows.get(finding.finding_id) else _FINDING_LINKS
+    title = f"{title_prefix} {finding.finding_id}"
+    return _finding_action(
+        action_id=_action_id(f"{tier}:resolve_blocker:{finding.finding_id}:{title}"),
         tier=tier,
-        action_type="resolve_blocker",
         target=finding.finding_id,
-        title=f"{title_prefix} {finding.finding_id}",
+        title=title,
         why_now=why_now,
         steps=[
             f"Review {finding.finding_id} dependencies ({dep_hint}) and impacted IDs ({impacted_hint}).",
@@ -222,13 +321,16 @@ def _finding_card(
     )
 
 
+# Repair cards for the known invariants have fixed seeds, so their ids are hashed once at import.
+_REPAIR_ACTION_IDS = {invariant_id: _action_id(_repair_seed(invariant_id)) for invariant_id in _REPAIR_ACTIONS}
+
+
 def _repair_card(invariant_id: str, message: str) -> Dict[str, object]:
     action = _REPAIR_ACTIONS.get(invariant_id, {})
-    return _build_action(
-        tier=3,
-        action_type="repair_invariant",
+    action_id = _REPAIR_ACTION_IDS.get(invariant_id) or _action_id(_repair_seed(invariant_id))
+    return _repair_action(
+        action_id=action_id,
         target=invariant_id,
-        title=f"Repair invariant: {invariant_id}",
         why_now=message,
         steps=[action.get("step", "Review evidence and repair canonical docs, then rerun validate.")],
         commands=[action.get("command", "python -m unittest tests/test_validator_fixtures.py")],
@@ -272,13 +374,20 @@ def build_action_queue(
         return _tier0_actions()
 
     playbook_path, matrix_path, rfc_path, state_db_path = _resolve_runtime_paths(ctx)
-    findings = parse_findings(playbook_path)
-    rows = parse_core_rows(matrix_path)
-    rfc_lines = extract_normative_lines(rfc_path)
+    findings = _cached_parse(parse_findings, playbook_path)
+    rows = _cached_parse(parse_core_rows, matrix_path)
+    rfc_lines = _cached_parse(extract_normative_lines, rfc_path)
     findings_by_id = {finding.finding_id: finding for finding in findings}
-    status_by_finding = _load_state_status(state_db_path)
-    finding_rows = _group_rows_by_finding(rows)
+    # Every playbook finding gets an entry up front; stored states (including unknown ids) override.
+    status_by_finding = dict.fromkeys(findings_by_id, _UNSTARTED)
+    status_by_finding.update(_load_state_status(state_db_path))
     normative_by_source = {line.rfc_line_id: line.normative_level for line in rfc_lines}
+    row_index = _index_rows_by_finding(rows, normative_by_source)
+    dependents = _reverse_dependencies(findings_by_id)
+    unblock_by_finding = {
+        finding_id: _dependency_unblock_count(finding_id, dependents, status_by_finding)
+        for finding_id in findings_by_id
+    }
     actions: List[Dict[str, object]] = []
 
     # Tier 1: unresolved Wave-1 blockers.
@@ -286,40 +395,31 @@ def build_action_queue(
         findings_by_id[finding_id]
         for finding_id in constants.WAVE1_BLOCKERS
         if finding_id in findings_by_id
-        and status_by_finding.get(finding_id, "unstarted") != _READY_FOR_VALIDATION
+        and status_by_finding[finding_id] != _READY_FOR_VALIDATION
     ]
-    wave1_candidates.sort(
-        key=lambda item: _finding_priority_key(
-            item,
-            findings_by_id,
-            status_by_finding,
-            finding_rows,
-            normative_by_source,
-        )
-    )
-    for finding in wave1_candidates:
+    ranked = [(_finding_priority_key(finding, unblock_by_finding, row_index), finding) for finding in wave1_candidates]
+    ranked.sort(key=_PRIORITY)
+    for (neg_unblock, neg_impact, _, _), finding in ranked:
         actions.append(
             _finding_card(
                 tier=1,
                 finding=finding,
-                status=status_by_finding.get(finding.finding_id, "unstarted"),
-                finding_rows=finding_rows,
-                dependency_unblock=_dependency_unblock_count(
-                    finding.finding_id,
-                    findings_by_id,
-                    status_by_finding,
-                ),
-                impact_count=_impact_count(finding, finding_rows),
+                status=status_by_finding[finding.finding_id],
+                finding_rows=row_index.rows,
+                dependency_unblock=-neg_unblock,
+                impact_count=-neg_impact,
                 is_blocker=True,
             )
         )
 
     # Tier 2: ready-for-validation gate.
-    ready_findings = sorted(
+    # SQLite hands the state rows back in no particular order, so the ids still need sorting.
+    ready_findings = [
         finding_id
         for finding_id, status in status_by_finding.items()
         if status == _READY_FOR_VALIDATION
-    )
+    ]
+    ready_findings.sort()
     if ready_findings:
         actions.append(
             _build_action(
@@ -343,47 +443,35 @@ def build_action_queue(
             actions.append(_repair_card(inv.id, inv.message))
 
     # Tier 4: non-blocker findings by impact.
+    # F-016 is handled by the Tier 5 section triage instead.
+    skip_ids = frozenset(constants.WAVE1_BLOCKERS).union(("F-016",))
     non_blockers = [
         finding
         for finding in findings
-        if finding.finding_id not in constants.WAVE1_BLOCKERS
-        and finding.finding_id != "F-016"
-        and status_by_finding.get(finding.finding_id, "unstarted") != _READY_FOR_VALIDATION
+        if finding.finding_id not in skip_ids
+        and status_by_finding[finding.finding_id] != _READY_FOR_VALIDATION
     ]
-    non_blockers.sort(
-        key=lambda item: _finding_priority_key(
-            item,
-            findings_by_id,
-            status_by_finding,
-            finding_rows,
-            normative_by_source,
-        )
-    )
-    for finding in non_blockers:
+    ranked = [(_finding_priority_key(finding, unblock_by_finding, row_index), finding) for finding in non_blockers]
+    ranked.sort(key=_PRIORITY)
+    for (neg_unblock, neg_impact, _, _), finding in ranked:
         actions.append(
             _finding_card(
                 tier=4,
                 finding=finding,
-                status=status_by_finding.get(finding.finding_id, "unstarted"),
-                finding_rows=finding_rows,
-                dependency_unblock=_dependency_unblock_count(
-                    finding.finding_id,
-                    findings_by_id,
-                    status_by_finding,
-                ),
-                impact_count=_impact_count(finding, finding_rows),
+                status=status_by_finding[finding.finding_id],
+                finding_rows=row_index.rows,
+                dependency_unblock=-neg_unblock,
+                impact_count=-neg_impact,
                 is_blocker=False,
             )
         )
 
     # Tier 5: section-scoped F-016 triage batches.
-    triage_counts: Dict[str, int] = defaultdict(int)
-    for row in rows:
-        if row.status not in {"gap", "partial"}:
-            continue
-        if "F-016" not in row.findings:
-            continue
-        triage_counts[_extract_section(row.source_ref)] += 1
+    triage_counts = Counter(
+        _extract_section(row.source_ref)
+        for row in rows
+        if row.status in _TRIAGE_STATUSES and "F-016" in row.findings
+    )
     for section, count in sorted(triage_counts.items(), key=lambda item: (-item[1], item[0])):
         actions.append(
             _build_action(
@@ -392,18 +480,9 @@ def build_action_queue(
                 f"F-016:{section}",
                 f"Triage F-016 in section {section}",
                 f"Section {section} has {count} F-016 gap/partial rows requiring triage.",
-                [
-                    "Review all F-016 rows for the section and group by shared root cause.",
-                    "Create concrete patches and move affected findings to in_progress.",
-                ],
-                [
-                    "rg \"F-016\" docs/requirements_trace_matrix.md",
-                    "python -m unittest tests/test_validator_fixtures.py",
-                ],
-                [
-                    "docs/requirements_trace_matrix.md",
-                    "docs/patch_playbook.md",
-                ],
+                _TRIAGE_STEPS,
+                _TRIAGE_COMMANDS,
+                _TRIAGE_LINKS,
             )
         )
 
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-from collections import deque
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
 import json
 import os
 import re
 import time
 from threading import Lock
-from typing import Any, Dict, Iterator, List, Literal, Tuple
+from typing import Any, Dict, FrozenSet, Iterator, List, Literal, Tuple
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
@@ -18,6 +17,8 @@ from app.backend.services import chat_session_service
 
 RiskTolerance = Literal["low", "medium", "high"]
 ProviderMode = Literal["auto", "openai", "local"]
+# (SSE event name, JSON object payload) pairs yielded by the stream entry points.
+StreamEvent = Tuple[str, Dict[str, Any]]
 
 _DEFAULT_OPENAI_MODEL = "gpt-4.1-mini"
 _DEFAULT_OPENAI_TIMEOUT_S = 30.0
@@ -27,7 +28,7 @@ _LOW_CONFIDENCE_THRESHOLD = 0.70
 _CORRECTION_PRESSURE_WINDOW = 6
 _CORRECTION_PRESSURE_THRESHOLD = 3
 
-_AMBIGUOUS_TOKENS = {
+_AMBIGUOUS_TOKENS = frozenset({
 	"thing",
 	"things",
 	"stuff",
@@ -40,9 +41,9 @@ _AMBIGUOUS_TOKENS = {
 	"maybe",
 	"nice",
 	"cool",
-}
+})
 
-_OBJECTIVE_VERBS = {
+_OBJECTIVE_VERBS = frozenset({
 	"build",
 	"create",
 	"design",
@@ -58,9 +59,9 @@ _OBJECTIVE_VERBS = {
 	"refactor",
 	"test",
 	"document",
-}
+})
 
-_CONVERSATION_TOKENS = {
+_CONVERSATION_TOKENS = frozenset({
 	"hi",
 	"hello",
 	"hey",
@@ -70,25 +71,27 @@ _CONVERSATION_TOKENS = {
 	"thank",
 	"morning",
 	"evening",
-}
+})
 
-_CONVERSATION_PHRASES = {
+_CONVERSATION_PHRASES = frozenset({
 	"what's up",
 	"how are you",
 	"can we chat",
 	"let's chat",
 	"just chatting",
 	"how's it going",
-}
+})
 
-_TASK_MARKERS = _OBJECTIVE_VERBS | {
+_THANKS_TOKENS = frozenset({"thanks", "thank"})
+
+_TASK_MARKERS = _OBJECTIVE_VERBS | frozenset({
 	"deadline",
 	"constraints",
 	"acceptance",
 	"milestone",
 	"roadmap",
-}
-_TASK_PHRASES = {
+})
+_TASK_PHRASES = frozenset({
 	"acceptance criteria",
 	"success criteria",
 	"implementation brief",
@@ -96,10 +99,37 @@ _TASK_PHRASES = {
 	"api",
 	"feature",
 	"bug",
+})
+# Callers holding already-lowered text use _TOKEN_RE.findall directly rather than _tokenize.
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9']+")
+_TASK_PHRASE_RE = re.compile(
+	r"\b(?:" + "|".join(re.escape(phrase).replace(r"\ ", r"\s+") for phrase in sorted(_TASK_PHRASES)) + r")\b"
+)
+_PREFIX_PATTERNS = {
+	label: re.compile(rf"(?im)^\s*{re.escape(label)}\s*:\s*(.+?)\s*$")
+	for label in ("constraints", "deadline", "risk", "goal", "done-when", "done when")
+}
+_CONSTRAINT_MARKERS = ("must", "should", "cannot", "deadline", "budget", "within")
+_STEP_COUNT_RE = re.compile(
+	r"\b(?:(?P<digits>\d{1,2})|(?P<word>two|three|four|five|six|seven|eight|nine|ten|eleven|twelve))"
+	r"\s*[\-\u2010-\u2015 ]?\s*step(?:s)?\b"
+)
+_STEP_COUNT_WORDS = {
+	"two": 2,
+	"three": 3,
+	"four": 4,
+	"five": 5,
+	"six": 6,
+	"seven": 7,
+	"eight": 8,
+	"nine": 9,
+	"ten": 10,
+	"eleven": 11,
+	"twelve": 12,
 }
 
-_RISK_TOKENS = {"auth", "payment", "security", "privacy", "legal", "medical", "finance", "production"}
-_GOVERNED_RISK_TOKENS = {
+_RISK_TOKENS = frozenset({"auth", "payment", "security", "privacy", "legal", "medical", "finance", "production"})
+_GOVERNED_RISK_TOKENS = frozenset({
 	"auth",
 	"payment",
 	"security",
@@ -110,8 +140,8 @@ _GOVERNED_RISK_TOKENS = {
 	"finance",
 	"production",
 	"prod",
-}
-_FRESHNESS_RETRIEVAL_TOKENS = {
+})
+_FRESHNESS_RETRIEVAL_TOKENS = frozenset({
 	"latest",
 	"current",
 	"today",
@@ -127,8 +157,8 @@ _FRESHNESS_RETRIEVAL_TOKENS = {
 	"sources",
 	"docs",
 	"web",
-}
-_MULTI_DECISION_TOKENS = {
+})
+_MULTI_DECISION_TOKENS = frozenset({
 	"architecture",
 	"system",
 	"roadmap",
@@ -138,16 +168,30 @@ _MULTI_DECISION_TOKENS = {
 	"integration",
 	"fuse",
 	"fusion",
-}
-_CORRECTION_PRESSURE_TOKENS = {"wrong", "fix", "again", "failed", "issue", "bug", "not"}
-
-
-def _adaptive_now() -> datetime:
-	return datetime.now(timezone.utc)
-
-
-def _adaptive_now_iso() -> str:
-	return _adaptive_now().isoformat().replace("+00:00", "Z")
+})
+_CORRECTION_PRESSURE_TOKENS = frozenset({"wrong", "fix", "again", "failed", "issue", "bug", "not"})
+_DEBUG_PHRASES = (
+	"failing test",
+	"tests failing",
+	"test failure",
+	"assertion error",
+	"stack trace",
+	"traceback",
+	"regression bug",
+)
+_DEBUG_MARKERS = frozenset({
+	"debug",
+	"bug",
+	"failing",
+	"failure",
+	"traceback",
+	"exception",
+	"flaky",
+	"crash",
+	"regression",
+	"broken",
+	"fix",
+})
 
 
 @dataclass
@@ -159,11 +203,17 @@ class _AdaptiveSessionState:
 	correction_pressure_signals: deque[bool] = field(
 		default_factory=lambda: deque(maxlen=_CORRECTION_PRESSURE_WINDOW)
 	)
-	updated_at: str = field(default_factory=lambda: _adaptive_now_iso())
+	# Number of True entries in correction_pressure_signals, kept in step with the window.
+	correction_pressure_count: int = 0
+	last_seen: float = field(default_factory=time.monotonic)
 
 
-_ADAPTIVE_SESSION_STATE: Dict[str, _AdaptiveSessionState] = {}
+# Kept in least-recently-used order, so eviction only ever looks at the oldest sessions.
+_ADAPTIVE_SESSION_STATE: OrderedDict[str, _AdaptiveSessionState] = OrderedDict()
+# Guards the session map only. A turn runs under its session's stripe lock, so turns on
+# different sessions do not queue behind each other; a stripe is always taken before this lock.
 _ADAPTIVE_SESSION_LOCK = Lock()
+_ADAPTIVE_TURN_LOCKS = tuple(Lock() for _ in range(64))
 
 
 def _adaptive_ttl_seconds() -> int:
@@ -173,29 +223,26 @@ def _adaptive_ttl_seconds() -> int:
 		return 6 * 60 * 60
 
 
-def _evict_adaptive_state_locked() -> None:
-	now = _adaptive_now()
-	ttl = timedelta(seconds=_adaptive_ttl_seconds())
-	expired: List[str] = []
-	for session_id, state in _ADAPTIVE_SESSION_STATE.items():
-		try:
-			updated = datetime.fromisoformat(state.updated_at.replace("Z", "+00:00"))
-		except ValueError:
-			expired.append(session_id)
-			continue
-		if now - updated > ttl:
-			expired.append(session_id)
-	for session_id in expired:
-		_ADAPTIVE_SESSION_STATE.pop(session_id, None)
+def _evict_adaptive_state_locked(now: float) -> None:
+	ttl = _adaptive_ttl_seconds()
+	while _ADAPTIVE_SESSION_STATE:
+		oldest = next(iter(_ADAPTIVE_SESSION_STATE.values()))
+		if now - oldest.last_seen <= ttl:
+			break
+		_ADAPTIVE_SESSION_STATE.popitem(last=False)
 
 
 def _adaptive_state_for_session_locked(session_id: str | None) -> _AdaptiveSessionState:
-	_evict_adaptive_state_locked()
+	now = time.monotonic()
+	_evict_adaptive_state_locked(now)
 	key = session_id or "__global__"
 	state = _ADAPTIVE_SESSION_STATE.get(key)
 	if state is None:
-		state = _AdaptiveSessionState(updated_at=_adaptive_now_iso())
+		state = _AdaptiveSessionState(last_seen=now)
 		_ADAPTIVE_SESSION_STATE[key] = state
+	else:
+		_ADAPTIVE_SESSION_STATE.move_to_end(key)
+		state.last_seen = now
 	return state
 
 _OPENAI_SYSTEM_PROMPT = """
@@ -272,76 +319,76 @@ def _aca_enabled() -> bool:
 
 
 def _tokenize(text: str) -> List[str]:
-	return re.findall(r"[a-zA-Z0-9']+", text.lower())
+	return _TOKEN_RE.findall(text.lower())
 
 
 def _has_task_markers(tokens: List[str]) -> bool:
-	return bool(set(tokens) & _TASK_MARKERS)
+	return not _TASK_MARKERS.isdisjoint(tokens)
 
 
 def _has_task_phrases(text: str) -> bool:
-	lowered = text.lower()
-	for phrase in _TASK_PHRASES:
-		pattern = r"\b" + re.escape(phrase).replace(r"\ ", r"\s+") + r"\b"
-		if re.search(pattern, lowered):
-			return True
-	return False
+	return _TASK_PHRASE_RE.search(text.lower()) is not None
 
 
 def _is_debug_request(user_input: str, context: str | None) -> bool:
 	combined = _combined_text(user_input, context).lower()
-	debug_phrases = (
-		"failing test",
-		"tests failing",
-		"test failure",
-		"assertion error",
-		"stack trace",
-		"traceback",
-		"regression bug",
-	)
-	for phrase in debug_phrases:
+	for phrase in _DEBUG_PHRASES:
 		if phrase in combined:
 			return True
-	debug_markers = {
-		"debug",
-		"bug",
-		"failing",
-		"failure",
-		"traceback",
-		"exception",
-		"flaky",
-		"crash",
-		"regression",
-		"broken",
-		"fix",
-	}
-	tokens = set(_tokenize(combined))
-	return bool(tokens & debug_markers)
+	return not _DEBUG_MARKERS.isdisjoint(_TOKEN_RE.findall(combined))
+
+
+@dataclass(frozen=True, slots=True)
+class _TurnText:
+	"""Lowered text and tokens for one turn, shared by the adaptive-protocol checks."""
+
+	user_text: str
+	user_tokens: List[str]
+	user_token_set: FrozenSet[str]
+	is_task_request: bool
+	combined_lower: str
+	combined_tokens: List[str]
+	combined_token_set: FrozenSet[str]
+
+
+def _turn_text(user_input: str, context: str | None) -> _TurnText:
+	user_text = " ".join(user_input.split()).lower()
+	user_tokens = _TOKEN_RE.findall(user_text)
+	combined_lower = _combined_text(user_input, context).lower()
+	combined_tokens = _TOKEN_RE.findall(combined_lower)
+	return _TurnText(
+		user_text=user_text,
+		user_tokens=user_tokens,
+		user_token_set=frozenset(user_tokens),
+		is_task_request=_has_task_markers(user_tokens) or _has_task_phrases(user_text),
+		combined_lower=combined_lower,
+		combined_tokens=combined_tokens,
+		combined_token_set=frozenset(combined_tokens),
+	)
 
 
-def _detect_interaction_mode(user_input: str, context: str | None) -> Literal["conversation", "task"]:
-	user_text = " ".join(user_input.split()).strip().lower()
-	user_tokens = _tokenize(user_text)
-	if _has_task_markers(user_tokens) or _has_task_phrases(user_text):
+def _detect_interaction_mode(text: _TurnText, context: str | None) -> Literal["conversation", "task"]:
+	user_text = text.user_text
+	if text.is_task_request:
 		return "task"
 	if not user_text:
 		if isinstance(context, str) and context.strip():
 			context_text = context.lower()
-			context_tokens = _tokenize(context_text)
+			context_tokens = _TOKEN_RE.findall(context_text)
 			if _has_task_markers(context_tokens) or _has_task_phrases(context_text):
 				return "task"
-			if set(context_tokens) & _CONVERSATION_TOKENS:
+			if not _CONVERSATION_TOKENS.isdisjoint(context_tokens):
 				return "conversation"
 			if any(phrase in context_text for phrase in _CONVERSATION_PHRASES):
 				return "conversation"
 		return "conversation"
-	if set(user_tokens) & _CONVERSATION_TOKENS:
+	if not _CONVERSATION_TOKENS.isdisjoint(text.user_token_set):
 		return "conversation"
 	if any(phrase in user_text for phrase in _CONVERSATION_PHRASES):
 		return "conversation"
 	if isinstance(context, str) and context.strip():
 		context_text = context.lower()
-		context_tokens = _tokenize(context_text)
+		context_tokens = _TOKEN_RE.findall(context_text)
 		if _has_task_markers(context_tokens) or _has_task_phrases(context_text):
 			return "task"
 	return "task"
@@ -353,13 +400,18 @@ def _conversation_response(user_input: str) -> str:
 		return "Hey. I'm here. What do you want to work on?"
 	if any(phrase in text.lower() for phrase in ["how are you", "what's up", "whats up"]):
 		return "I'm ready. Tell me what you want to build, fix, or decide, and we'll work it step by step."
-	if any(token in _tokenize(text) for token in {"thanks", "thank"}):
+	if not _THANKS_TOKENS.isdisjoint(_tokenize(text)):
 		return "You're welcome. Want to keep going or switch tasks?"
 	return "Yeah, we can chat. Tell me your goal in plain language and I will help you make it actionable."
 
 
-def _ambiguity_score(user_input: str, context: str | None) -> Tuple[float, List[str]]:
-	tokens = _tokenize(user_input)
+def _ambiguity_score(
+	user_input: str,
+	context: str | None,
+	tokens: List[str] | None = None,
+) -> Tuple[float, List[str]]:
+	if tokens is None:
+		tokens = _tokenize(user_input)
 	score = 0.0
 	reasons: List[str] = []
 
@@ -367,12 +419,12 @@ def _ambiguity_score(user_input: str, context: str | None) -> Tuple[float, List[
 		score += 0.25
 		reasons.append("short_request")
 
-	hits = sorted({token for token in tokens if token in _AMBIGUOUS_TOKENS})
+	hits = sorted(_AMBIGUOUS_TOKENS.intersection(tokens))
 	if hits:
 		score += min(0.45, 0.12 * len(hits))
 		reasons.append(f"ambiguous_terms:{','.join(hits)}")
 
-	if not any(token in _OBJECTIVE_VERBS for token in tokens):
+	if _OBJECTIVE_VERBS.isdisjoint(tokens):
 		score += 0.2
 		reasons.append("missing_explicit_action")
 
@@ -391,8 +443,7 @@ def _combined_text(user_input: str, context: str | None) -> str:
 
 
 def _extract_prefixed_value(text: str, label: str) -> str:
-	pattern = re.compile(rf"(?im)^\s*{re.escape(label)}\s*:\s*(.+?)\s*$")
-	match = pattern.search(text)
+	match = _PREFIX_PATTERNS[label].search(text)
 	if not match:
 		return ""
 	return " ".join(match.group(1).split()).strip()
@@ -402,20 +453,27 @@ def _extract_constraints(text: str) -> List[str]:
 	prefixed = _extract_prefixed_value(text, "constraints")
 	constraints: List[str] = []
 	if prefixed:
-		for item in re.split(r"[;,|]", prefixed):
+		# str.replace/str.split beat re.split for a three-character separator class.
+		for item in prefixed.replace(",", ";").replace("|", ";").split(";"):
 			cleaned = " ".join(item.split()).strip()
 			if cleaned:
 				constraints.append(cleaned)
 	if constraints:
 		return constraints[:4]
-	lines = [line.strip() for line in text.splitlines() if line.strip()]
-	for line in lines:
+	# Only the first four distinct constraint lines are kept, so stop reading once they are found.
+	seen = set()
+	for line in text.splitlines():
 		lowered = line.lower()
-		if any(marker in lowered for marker in ["must", "should", "cannot", "deadline", "budget", "within"]):
-			constraints.append(" ".join(line.split()).strip())
+		if any(marker in lowered for marker in _CONSTRAINT_MARKERS):
+			cleaned = " ".join(line.split())
+			if cleaned not in seen:
+				seen.add(cleaned)
+				constraints.append(cleaned)
+				if len(constraints) == 4:
+					break
 	if not constraints:
 		constraints.append("No explicit constraints provided; confirm constraints before irreversible changes.")
-	return list(dict.fromkeys(constraints))[:4]
+	return constraints
 
 
 def _extract_deadline(text: str) -> str:
@@ -481,8 +539,8 @@ def _extract_intake_frame(
 	}
 
 
-def _forced_lane_override(user_input: str, context: str | None) -> str | None:
-	combined = _combined_text(user_input, context).lower()
+def _forced_lane_override(text: _TurnText) -> str | None:
+	combined = text.combined_lower
 	if any(flag in combined for flag in ["full governed", "governed only", "full governance"]):
 		return "governed"
 	if "quick only" in combined:
@@ -490,41 +548,39 @@ def _forced_lane_override(user_input: str, context: str | None) -> str | None:
 	return None
 
 
-def _is_freshness_or_retrieval_dependent(tokens: List[str], text: str) -> bool:
-	if set(tokens) & _FRESHNESS_RETRIEVAL_TOKENS:
+def _is_freshness_or_retrieval_dependent(text: _TurnText) -> bool:
+	if not _FRESHNESS_RETRIEVAL_TOKENS.isdisjoint(text.combined_token_set):
 		return True
-	lowered = text.lower()
+	lowered = text.combined_lower
 	return any(phrase in lowered for phrase in ["look up", "search for", "latest ", "current "])
 
 
-def _is_multi_decision_scope(tokens: List[str], text: str) -> bool:
-	if len(tokens) >= 28:
+def _is_multi_decision_scope(text: _TurnText) -> bool:
+	token_count = len(text.combined_tokens)
+	if token_count >= 28:
 		return True
-	if len(set(tokens) & _MULTI_DECISION_TOKENS) >= 2:
+	if len(text.combined_token_set & _MULTI_DECISION_TOKENS) >= 2:
 		return True
-	lowered = text.lower()
-	if lowered.count(" and ") >= 3 and len(tokens) >= 24:
+	lowered = text.combined_lower
+	if lowered.count(" and ") >= 3 and token_count >= 24:
 		return True
 	return lowered.count(" then ") >= 2
 
 
 def _complexity_reasons(
 	*,
-	user_input: str,
-	context: str | None,
+	text: _TurnText,
 	ambiguity_score: float,
 	ambiguity_threshold: float,
 ) -> List[str]:
-	combined = _combined_text(user_input, context)
-	tokens = _tokenize(combined)
 	reasons: List[str] = []
 	if ambiguity_score > ambiguity_threshold:
 		reasons.append("ambiguity_over_threshold")
-	if set(tokens) & _GOVERNED_RISK_TOKENS:
+	if not _GOVERNED_RISK_TOKENS.isdisjoint(text.combined_token_set):
 		reasons.append("risk_domain_signal")
-	if _is_freshness_or_retrieval_dependent(tokens, combined):
+	if _is_freshness_or_retrieval_dependent(text):
 		reasons.append("freshness_or_retrieval_required")
-	if _is_multi_decision_scope(tokens, combined):
+	if _is_multi_decision_scope(text):
 		reasons.append("multi_decision_scope")
 	return reasons
 
@@ -543,6 +599,10 @@ def _adaptive_state_for_session(session_id: str | None) -> _AdaptiveSessionState
 		return _adaptive_state_for_session_locked(session_id)
 
 
+def _adaptive_turn_lock(session_id: str | None) -> Lock:
+	return _ADAPTIVE_TURN_LOCKS[hash(session_id or "__global__") % len(_ADAPTIVE_TURN_LOCKS)]
+
+
 def _quick_contract_response(
 	*,
 	result: Dict[str, object],
@@ -614,7 +674,7 @@ def _apply_evolution_policy(
 ) -> List[Dict[str, str]]:
 	events: List[Dict[str, str]] = []
 	prev_failures = state.consecutive_governed_failures
-	prev_correction_count = sum(1 for signal in state.correction_pressure_signals if signal)
+	prev_correction_count = state.correction_pressure_count
 	state.consecutive_governed_failures = prev_failures + 1 if governed_failure else 0
 
 	for key in missing_decision_keys:
@@ -632,8 +692,13 @@ def _apply_evolution_policy(
 				}
 			)
 
-	state.correction_pressure_signals.append(correction_pressure)
-	correction_count = sum(1 for signal in state.correction_pressure_signals if signal)
+	signals = state.correction_pressure_signals
+	if len(signals) == signals.maxlen and signals[0]:
+		state.correction_pressure_count -= 1
+	signals.append(correction_pressure)
+	if correction_pressure:
+		state.correction_pressure_count += 1
+	correction_count = state.correction_pressure_count
 
 	if prev_failures < 2 <= state.consecutive_governed_failures:
 		old_threshold = state.ambiguity_threshold
@@ -679,23 +744,21 @@ def _apply_adaptive_protocol(
 	max_questions: int,
 	session_id: str | None,
 ) -> Dict[str, object]:
-	with _ADAPTIVE_SESSION_LOCK:
-		state = _adaptive_state_for_session_locked(session_id)
-		state.updated_at = _adaptive_now_iso()
+	with _adaptive_turn_lock(session_id):
+		state = _adaptive_state_for_session(session_id)
 		intake_frame = _extract_intake_frame(
 			user_input=user_input,
 			context=context,
 			risk_tolerance=risk_tolerance,
 		)
-		local_ambiguity, ambiguity_notes = _ambiguity_score(user_input, context)
-		interaction_mode = _detect_interaction_mode(user_input, context)
-		user_tokens = _tokenize(user_input)
-		is_task_request = _has_task_markers(user_tokens) or _has_task_phrases(user_input)
+		turn_text = _turn_text(user_input, context)
+		local_ambiguity, ambiguity_notes = _ambiguity_score(user_input, context, turn_text.user_tokens)
+		interaction_mode = _detect_interaction_mode(turn_text, context)
+		is_task_request = turn_text.is_task_request
 		ambiguous_terms_present = any(note.startswith("ambiguous_terms") for note in ambiguity_notes)
-		forced_lane = _forced_lane_override(user_input, context)
+		forced_lane = _forced_lane_override(turn_text)
 		complexity_reasons = _complexity_reasons(
-			user_input=user_input,
-			context=context,
+			text=turn_text,
 			ambiguity_score=local_ambiguity,
 			ambiguity_threshold=state.ambiguity_threshold,
 		)
@@ -766,7 +829,7 @@ def _apply_adaptive_protocol(
 				assumptions.append("Assumed constraints and environment remain valid until explicitly corrected.")
 			if "risk_domain_signal" in complexity_reasons:
 				assumptions.append("Assumed risk-sensitive operations require conservative safety handling.")
-			assumptions = list(dict.fromkeys(str(item).strip() for item in assumptions if str(item).strip()))
+			assumptions = list(dict.fromkeys(filter(None, (str(item).strip() for item in assumptions))))
 			if assumptions:
 				result["assumptions"] = assumptions
 		else:
@@ -829,7 +892,7 @@ def _apply_adaptive_protocol(
 		if not intake_frame.get("done_when"):
 			missing_decision_keys.append("done_when")
 
-		combined_text = _combined_text(user_input, context).lower()
+		combined_text = turn_text.combined_lower
 		correction_pressure = any(token in combined_text for token in _CORRECTION_PRESSURE_TOKENS)
 		fallback = result.get("fallback")
 		fallback_triggered = isinstance(fallback, dict) and bool(fallback.get("triggered"))
@@ -909,32 +972,25 @@ def _fallback_policy_text(risk_tolerance: RiskTolerance) -> str:
 
 
 def _requested_step_count(text: str) -> int | None:
-	lowered = text.lower()
-	digit_match = re.search(r"\b(\d{1,2})\s*[\-\u2010-\u2015 ]?\s*step(?:s)?\b", lowered)
-	if digit_match:
-		value = int(digit_match.group(1))
-		if 2 <= value <= 12:
-			return value
-	word_to_value = {
-		"two": 2,
-		"three": 3,
-		"four": 4,
-		"five": 5,
-		"six": 6,
-		"seven": 7,
-		"eight": 8,
-		"nine": 9,
-		"ten": 10,
-		"eleven": 11,
-		"twelve": 12,
-	}
-	word_match = re.search(
-		r"\b(two|three|four|five|six|seven|eight|nine|ten|eleven|twelve)\s*[\-\u2010-\u2015 ]?\s*step(?:s)?\b",
-		lowered,
-	)
-	if word_match:
-		return word_to_value[word_match.group(1)]
-	return None
+	# One scan over both spellings. The first numeric count wins when it is in range;
+	# otherwise the first spelled-out count applies, wherever it appears.
+	word_value: int | None = None
+	digits_pending = True
+	for match in _STEP_COUNT_RE.finditer(text.lower()):
+		word = match.group("word")
+		if word is not None:
+			if word_value is None:
+				word_value = _STEP_COUNT_WORDS[word]
+				if not digits_pending:
+					return word_value
+		elif digits_pending:
+			digits_pending = False
+			value = int(match.group("digits"))
+			if 2 <= value <= 12:
+				return value
+			if word_value is not None:
+				return word_value
+	return word_value
 
 
 def _enforce_step_count(plan: List[str], target_count: int) -> List[str]:
@@ -1122,7 +1178,7 @@ def _score_quality(
 ) -> Dict[str, object]:
 	has_numbered_steps = "1." in candidate_response
 	tokens = _tokenize(user_input)
-	risk_signal = any(token in _RISK_TOKENS for token in tokens)
+	risk_signal = not _RISK_TOKENS.isdisjoint(tokens)
 
 	clarity = 7
 	if has_numbered_steps:
@@ -2006,7 +2062,7 @@ def stream_respond(
 	model: str | None = None,
 	session_id: str | None = None,
 	trace_enabled: bool = False,
-) -> Iterator[Dict[str, Any]]:
+) -> Iterator[StreamEvent]:
 	started_at = time.perf_counter()
 	cleaned = " ".join(user_input.split())
 	if not cleaned:
@@ -2018,16 +2074,13 @@ def stream_respond(
 	session_context = _session_context_text(session_id, chat_session_service.default_context_turns())
 	combined_context = _merge_context(context, session_context)
 
-	yield {
-		"event": "meta",
-		"data": {
-			"provider_mode": effective_mode,
-			"configured_provider_mode": mode,
-			"model": resolved_model,
-			"session_id": session_id,
-			"aca_enabled": _aca_enabled(),
-			"trace_enabled": trace_enabled,
-		},
+	yield "meta", {
+		"provider_mode": effective_mode,
+		"configured_provider_mode": mode,
+		"model": resolved_model,
+		"session_id": session_id,
+		"aca_enabled": _aca_enabled(),
+		"trace_enabled": trace_enabled,
 	}
 
 	trace_events: List[dict] = []
@@ -2044,7 +2097,7 @@ def stream_respond(
 		)
 		if trace_enabled:
 			for event in trace_events:
-				yield {"event": "trace", "data": event}
+				yield "trace", event
 	else:
 		if effective_mode == "local":
 			result = _respond_local(
@@ -2074,7 +2127,7 @@ def stream_respond(
 	_attach_runtime_metrics(result, started_at)
 	deltas = _chunk_text(str(result.get("candidate_response", "")))
 	for delta in deltas:
-		yield {"event": "delta", "data": {"text": delta}}
+		yield "delta", {"text": delta}
 
 	result["model"] = resolved_model
 	result["provider_mode"] = effective_mode
@@ -2086,10 +2139,7 @@ def stream_respond(
 	}
 	if trace_enabled:
 		done_data["aca_trace"] = trace_events
-	yield {
-		"event": "done",
-		"data": done_data,
-	}
+	yield "done", done_data
 
 
 def respond_v2_with_trace(
@@ -2153,7 +2203,7 @@ def stream_v2(
 	model: str | None = None,
 	session_id: str | None = None,
 	trace_enabled: bool = False,
-) -> Iterator[Dict[str, Any]]:
+) -> Iterator[StreamEvent]:
 	started_at = time.perf_counter()
 	cleaned = " ".join(user_input.split())
 	if not cleaned:
@@ -2165,17 +2215,14 @@ def stream_v2(
 	session_context = _session_context_text(session_id, chat_session_service.default_context_turns())
 	combined_context = _merge_context(context, session_context)
 
-	yield {
-		"event": "meta",
-		"data": {
-			"api_version": "v2",
-			"aca_version": "4.1",
-			"provider_mode": effective_mode,
-			"configured_provider_mode": mode,
-			"model": resolved_model,
-			"session_id": session_id,
-			"trace_enabled": trace_enabled,
-		},
+	yield "meta", {
+		"api_version": "v2",
+		"aca_version": "4.1",
+		"provider_mode": effective_mode,
+		"configured_provider_mode": mode,
+		"model": resolved_model,
+		"session_id": session_id,
+		"trace_enabled": trace_enabled,
 	}
 
 	result, trace = _run_aca_pipeline(
@@ -2201,22 +2248,19 @@ def stream_v2(
 	result["provider_mode"] = effective_mode
 
 	for event in trace:
-		yield {
-			"event": "checkpoint",
-			"data": {
-				"module_id": event.get("module_id"),
-				"module_name": event.get("module_name"),
-				"status": event.get("status"),
-				"tier": event.get("tier"),
-				"detail": event.get("detail"),
-			},
+		yield "checkpoint", {
+			"module_id": event.get("module_id"),
+			"module_name": event.get("module_name"),
+			"status": event.get("status"),
+			"tier": event.get("tier"),
+			"detail": event.get("detail"),
 		}
 		if trace_enabled:
-			yield {"event": "trace", "data": event}
+			yield "trace", event
 
 	message = str(result.get("final_message") or result.get("candidate_response") or "")
 	for delta in _chunk_text(message):
-		yield {"event": "delta", "data": {"text": delta}}
+		yield "delta", {"text": delta}
 
 	v2 = _build_v2_payload(
 		result=result,
@@ -2225,4 +2269,4 @@ def stream_v2(
 		trace_enabled=trace_enabled,
 	)
 	_append_session_turns(session_id, cleaned, {"final_message": v2.get("final_message", "")})
-	yield {"event": "done", "data": v2}
+	yield "done", v2
@@ -7,6 +7,7 @@ from threading import Lock
 from typing import Dict, List
 
 from app.backend.aca import policies
+from app.backend.time_utils import now_iso
 
 
 _DEFAULT_TTL_SECONDS = 6 * 60 * 60
@@ -36,10 +37,6 @@ def _now() -> datetime:
 	return datetime.now(timezone.utc)
 
 
-def _now_iso() -> str:
-	return _now().isoformat().replace("+00:00", "Z")
-
-
 def _int_env(name: str, default: int, minimum: int = 1) -> int:
 	raw = os.getenv(name, "").strip()
 	if not raw:
@@ -84,7 +81,7 @@ def ensure_session(session_id: str) -> ChatSession:
 		_evict_expired_locked()
 		session = _STORE.get(session_id)
 		if session is None:
-			session = ChatSession(session_id=session_id, updated_at=_now_iso(), turns=[])
+			session = ChatSession(session_id=session_id, updated_at=now_iso(), turns=[])
 			_STORE[session_id] = session
 		return session
 
@@ -103,11 +100,11 @@ def append_turn(session_id: str, role: str, text: str) -> ChatSession:
 		_evict_expired_locked()
 		session = _STORE.get(session_id)
 		if session is None:
-			session = ChatSession(session_id=session_id, updated_at=_now_iso(), turns=[])
+			session = ChatSession(session_id=session_id, updated_at=now_iso(), turns=[])
 			_STORE[session_id] = session
-		session.turns.append(ChatTurn(role=role_clean, text=cleaned, created_at=_now_iso()))
+		session.turns.append(ChatTurn(role=role_clean, text=cleaned, created_at=now_iso()))
 		session.turns = session.turns[-max_turns() :]
-		session.updated_at = _now_iso()
+		session.updated_at = now_iso()
 		return session
 
 
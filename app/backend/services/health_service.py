@@ -1,7 +1,10 @@
 ﻿from __future__ import annotations
 
+import copy
 import re
-from typing import Dict, List
+import time
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
 from app.backend import constants
 from app.backend.adapters import sqlite_adapter
@@ -11,6 +14,10 @@ from app.backend.validators.rfc_normative import extract_normative_lines
 
 
 _BLOCKER_RE = re.compile(r"F-\d{3}")
+_SUMMARY_TTL_S = 0.5
+# Held while building, so concurrent callers share one build and clears wait for it to land.
+_SUMMARY_LOCK = Lock()
+_SUMMARY_CACHE: Tuple[Tuple[str, ...], float, Optional[Dict[str, object]]] = ((), 0.0, None)
 
 
 def _parse_wave1_blockers(handoff_path: str) -> List[str]:
@@ -31,7 +38,7 @@ def _parse_wave1_blockers(handoff_path: str) -> List[str]:
 	return sorted(set(blockers))
 
 
-def get_summary() -> Dict[str, object]:
+def _build_summary() -> Dict[str, object]:
 	rfc_count = len(extract_normative_lines(constants.DEFAULT_RFC_PATH))
 	matrix_rows = parse_core_rows(constants.DEFAULT_MATRIX_PATH)
 	matrix_count = len(matrix_rows)
@@ -42,8 +49,7 @@ def get_summary() -> Dict[str, object]:
 			coverage[row.status] += 1
 
 	blockers = _parse_wave1_blockers(constants.DEFAULT_HANDOFF_PATH)
-	states = sqlite_adapter.list_finding_states(db_path=constants.DEFAULT_DB_PATH)
-	state_map = {row["finding_id"]: row["status"] for row in states}
+	state_map = sqlite_adapter.fetch_finding_status_map(db_path=constants.DEFAULT_DB_PATH)
 	unresolved = [bid for bid in blockers if state_map.get(bid) != "ready_for_validation"]
 
 	findings = parse_findings(constants.DEFAULT_PLAYBOOK_PATH)
@@ -63,3 +69,39 @@ def get_summary() -> Dict[str, object]:
 		"findings": {"total": total, "by_wave": by_wave, "by_severity": by_severity},
 		"storage": sqlite_adapter.get_storage_meta(constants.DEFAULT_DB_PATH),
 	}
+
+
+def clear_summary_cache() -> None:
+	global _SUMMARY_CACHE
+	with _SUMMARY_LOCK:
+		_SUMMARY_CACHE = ((), 0.0, None)
+
+
+def _summary_sources() -> Tuple[str, ...]:
+	return (
+		constants.DEFAULT_RFC_PATH,
+		constants.DEFAULT_MATRIX_PATH,
+		constants.DEFAULT_HANDOFF_PATH,
+		constants.DEFAULT_PLAYBOOK_PATH,
+		constants.DEFAULT_DB_PATH,
+	)
+
+
+def _cached_summary(sources: Tuple[str, ...]) -> Optional[Dict[str, object]]:
+	cached_sources, cached_at, summary = _SUMMARY_CACHE
+	if cached_sources != sources or time.monotonic() - cached_at >= _SUMMARY_TTL_S:
+		return None
+	return summary
+
+
+def get_summary() -> Dict[str, object]:
+	global _SUMMARY_CACHE
+	sources = _summary_sources()
+	summary = _cached_summary(sources)
+	if summary is None:
+		with _SUMMARY_LOCK:
+			summary = _cached_summary(sources)
+			if summary is None:
+				summary = _build_summary()
+				_SUMMARY_CACHE = (sources, time.monotonic(), summary)
+	return copy.deepcopy(summary)
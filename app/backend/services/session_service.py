@@ -1,20 +1,16 @@
 ﻿from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple, cast
 
 from app.backend import constants
 from app.backend.adapters import docs_adapter, process_adapter, sqlite_adapter
 from app.backend.services import action_queue_service, health_service
+from app.backend.time_utils import now_iso
 from app.backend.validators.engine import run_all_validators
 from app.backend.validators.types import InvariantResult, RunRecords, ValidatorContext, ValidatorReport
 
 
-def _now_iso() -> str:
-	return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-
-
 def _build_context(run_records: RunRecords) -> ValidatorContext:
 	paths = docs_adapter.get_default_paths()
 	return ValidatorContext(
@@ -68,9 +64,9 @@ def run_validate() -> Tuple[ValidatorReport, Dict[str, str], ValidatorContext]:
 		validate_exit_code=0,
 	)
 	ctx = _build_context(run_records)
-	started_at = _now_iso()
+	started_at = now_iso()
 	report = run_all_validators(ctx)
-	ended_at = _now_iso()
+	ended_at = now_iso()
 	status = "pass" if report.status == "pass" else "fail"
 	run_event = {
 		"run_id": run_id,
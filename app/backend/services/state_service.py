@@ -1,9 +1,12 @@
 ﻿from __future__ import annotations
 
-from typing import Dict, List, Optional
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from app.backend import constants
 from app.backend.adapters import sqlite_adapter
+from app.backend.services import health_service
 from app.backend.validators.matrix_parser import parse_core_rows
 from app.backend.validators.playbook_parser import parse_findings
 from app.backend.validators.rfc_normative import extract_normative_lines
@@ -23,26 +26,65 @@ def _state_map() -> Dict[str, Dict[str, str]]:
 	return {row["finding_id"]: row for row in rows}
 
 
-def _finding_models() -> List[Dict[str, object]]:
-	findings = parse_findings(constants.DEFAULT_PLAYBOOK_PATH)
-	state_map = _state_map()
-	models: List[Dict[str, object]] = []
-	for finding in findings:
-		state = state_map.get(finding.finding_id)
-		status = state["status"] if state else "unstarted"
-		models.append(
+@dataclass(slots=True)
+class _FindingStore:
+	rows: List[Dict[str, object]]
+	positions: Dict[str, List[int]]
+	by_blocker: Dict[bool, List[int]]
+
+
+@dataclass(slots=True)
+class _RequirementStore:
+	rows: List[Dict[str, object]]
+	positions: Dict[str, List[int]]
+	by_status: Dict[str, List[int]]
+	by_finding: Dict[str, List[int]]
+
+
+# (file signature, store) pairs, swapped as one tuple so concurrent readers never see a torn pair.
+_FINDING_STORE: Tuple[Tuple[object, ...], Optional[_FindingStore]] = ((), None)
+_REQUIREMENT_STORE: Tuple[Tuple[object, ...], Optional[_RequirementStore]] = ((), None)
+
+
+def _file_signature(path: str) -> Tuple[object, ...]:
+	stat = os.stat(path)
+	return (path, stat.st_mtime_ns, stat.st_size)
+
+
+def _finding_store() -> _FindingStore:
+	global _FINDING_STORE
+	signature = _file_signature(constants.DEFAULT_PLAYBOOK_PATH)
+	cached_signature, store = _FINDING_STORE
+	if store is not None and cached_signature == signature:
+		return store
+	store = _FindingStore(rows=[], positions={}, by_blocker={True: [], False: []})
+	for position, finding in enumerate(parse_findings(constants.DEFAULT_PLAYBOOK_PATH)):
+		store.rows.append(
 			{
 				"finding_id": finding.finding_id,
 				"is_wave1_blocker": finding.is_wave1_blocker,
 				"dependencies": sorted(finding.dependencies),
 				"impacted_req_ids": sorted(finding.impacted_req_ids),
 				"impact_count": len(set(finding.impacted_req_ids)),
-				"app_status": status,
-				"proof_expectations": [],
-				"source_refs": [],
 			}
 		)
-	return models
+		store.positions.setdefault(finding.finding_id, []).append(position)
+		store.by_blocker[bool(finding.is_wave1_blocker)].append(position)
+	_FINDING_STORE = (signature, store)
+	return store
+
+
+def _finding_model(row: Dict[str, object], status: str) -> Dict[str, object]:
+	return {
+		"finding_id": row["finding_id"],
+		"is_wave1_blocker": row["is_wave1_blocker"],
+		"dependencies": list(row["dependencies"]),
+		"impacted_req_ids": list(row["impacted_req_ids"]),
+		"impact_count": row["impact_count"],
+		"app_status": status,
+		"proof_expectations": [],
+		"source_refs": [],
+	}
 
 
 def list_findings(
@@ -51,21 +93,42 @@ def list_findings(
 	is_blocker: Optional[bool] = None,
 	status: Optional[str] = None,
 ) -> List[Dict[str, object]]:
-	findings = _finding_models()
+	store = _finding_store()
+	blocker = {1: True, 2: False}.get(wave)
+	if is_blocker is not None:
+		if blocker is not None and blocker != is_blocker:
+			return []
+		blocker = is_blocker
+
+	# Narrow through the indices first; only the surviving rows are looked up in the state map.
+	if finding_id:
+		candidates = store.positions.get(finding_id, [])
+		if blocker is not None:
+			candidates = [position for position in candidates if store.rows[position]["is_wave1_blocker"] == blocker]
+	elif blocker is not None:
+		candidates = store.by_blocker[blocker]
+	else:
+		candidates = range(len(store.rows))
+
+	if status and status != "unstarted":
+		# Findings without a stored state are "unstarted", so other statuses come straight from SQLite.
+		rows = sqlite_adapter.list_finding_states(status=status, db_path=constants.DEFAULT_DB_PATH)
+		matched = {row["finding_id"] for row in rows}
+		return [
+			_finding_model(store.rows[position], status)
+			for position in candidates
+			if store.rows[position]["finding_id"] in matched
+		]
+
+	state_map = _state_map()
 	filtered = []
-	for finding in findings:
-		if finding_id and finding["finding_id"] != finding_id:
-			continue
-		if wave is not None:
-			if wave == 1 and not finding["is_wave1_blocker"]:
-				continue
-			if wave == 2 and finding["is_wave1_blocker"]:
-				continue
-		if is_blocker is not None and finding["is_wave1_blocker"] != is_blocker:
-			continue
-		if status and finding["app_status"] != status:
+	for position in candidates:
+		row = store.rows[position]
+		state = state_map.get(row["finding_id"])
+		app_status = state["status"] if state else "unstarted"
+		if status and app_status != status:
 			continue
-		filtered.append(finding)
+		filtered.append(_finding_model(row, app_status))
 	return filtered
 
 
@@ -87,34 +150,27 @@ def update_finding_state(
 		raise ValueError("Invalid status value.")
 	if status not in _TRANSITIONS.get(current_status, set()):
 		raise ValueError("Illegal state transition.")
-	return sqlite_adapter.upsert_finding_state(
+	updated = sqlite_adapter.upsert_finding_state(
 		finding_id=finding_id,
 		status=status,
 		note=note,
 		db_path=constants.DEFAULT_DB_PATH,
 	)
+	health_service.clear_summary_cache()
+	return updated
 
 
-def list_requirements(
-	req_id: Optional[str] = None,
-	status: Optional[str] = None,
-	finding: Optional[str] = None,
-	section: Optional[str] = None,
-) -> List[Dict[str, object]]:
-	rows = parse_core_rows(constants.DEFAULT_MATRIX_PATH)
+def _requirement_store() -> _RequirementStore:
+	global _REQUIREMENT_STORE
+	signature = _file_signature(constants.DEFAULT_MATRIX_PATH) + _file_signature(constants.DEFAULT_RFC_PATH)
+	cached_signature, store = _REQUIREMENT_STORE
+	if store is not None and cached_signature == signature:
+		return store
 	rfc_lines = extract_normative_lines(constants.DEFAULT_RFC_PATH)
 	normative_map = {line.rfc_line_id: line.normative_level for line in rfc_lines}
-	requirements: List[Dict[str, object]] = []
-	for row in rows:
-		if req_id and row.req_id != req_id:
-			continue
-		if status and row.status != status:
-			continue
-		if finding and finding not in row.findings:
-			continue
-		if section and not row.source_ref.startswith(f"RFC {section}:"):
-			continue
-		requirements.append(
+	store = _RequirementStore(rows=[], positions={}, by_status={}, by_finding={})
+	for position, row in enumerate(parse_core_rows(constants.DEFAULT_MATRIX_PATH)):
+		store.rows.append(
 			{
 				"req_id": row.req_id,
 				"status": row.status,
@@ -125,4 +181,40 @@ def list_requirements(
 				"source_ref": row.source_ref,
 			}
 		)
+		store.positions.setdefault(row.req_id, []).append(position)
+		store.by_status.setdefault(row.status, []).append(position)
+		for finding_id in dict.fromkeys(row.findings):
+			store.by_finding.setdefault(finding_id, []).append(position)
+	_REQUIREMENT_STORE = (signature, store)
+	return store
+
+
+def list_requirements(
+	req_id: Optional[str] = None,
+	status: Optional[str] = None,
+	finding: Optional[str] = None,
+	section: Optional[str] = None,
+) -> List[Dict[str, object]]:
+	store = _requirement_store()
+	candidates: Sequence[int] = range(len(store.rows))
+	for value, index in ((req_id, store.positions), (status, store.by_status), (finding, store.by_finding)):
+		if value:
+			indexed = index.get(value, [])
+			if len(indexed) < len(candidates):
+				candidates = indexed
+	section_prefix = f"RFC {section}:" if section else None
+	requirements: List[Dict[str, object]] = []
+	for position in candidates:
+		row = store.rows[position]
+		if req_id and row["req_id"] != req_id:
+			continue
+		if status and row["status"] != status:
+			continue
+		if finding and finding not in row["linked_findings"]:
+			continue
+		if section_prefix and not row["source_ref"].startswith(section_prefix):
+			continue
+		requirement = dict(row)
+		requirement["linked_findings"] = list(row["linked_findings"])
+		requirements.append(requirement)
 	return requirements
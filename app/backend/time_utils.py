@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import time
+from typing import Tuple
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last call; swapped as one tuple so threads never see a torn pair.
+_SECOND_PREFIX: Tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+	# Same output as datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"), including the
+	# omitted fraction on whole seconds; only the microseconds are formatted on most calls.
+	global _SECOND_PREFIX
+	seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+	cached_seconds, prefix = _SECOND_PREFIX
+	if seconds != cached_seconds:
+		prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+		_SECOND_PREFIX = (seconds, prefix)
+	micros = nanos // 1000
+	if micros:
+		return f"{prefix}.{micros:06d}Z"
+	return prefix + "Z"
@@ -50,3 +50,10 @@ class ACAM10M13Tests(TestCase):
 		self.assertIsInstance(module_outputs["M12"].get("outline"), list)
 		self.assertIsInstance(module_outputs["M13"].get("contradictions"), list)
 		self.assertIsInstance(result.get("decision_graph"), list)
+
+	def test_m10_task_type_follows_rule_priority_not_token_order(self) -> None:
+		orchestrator = ACAOrchestrator(ACAOrchestratorHooks(build_result=_dummy_build_result))
+		result, _trace = orchestrator.run(self._make_request("Plan a fix for the architecture."))
+		self.assertEqual(result["module_outputs"]["M10"]["task_type"], "SYSTEM_DESIGN")
+		result, _trace = orchestrator.run(self._make_request("Fix the plan."))
+		self.assertEqual(result["module_outputs"]["M10"]["task_type"], "PLANNING")
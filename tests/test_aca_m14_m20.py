@@ -73,6 +73,9 @@ class ACAM14M20Tests(TestCase):
 		self.assertIn("M18", module_outputs)
 		self.assertIn("M19", module_outputs)
 		self.assertIn("M20", module_outputs)
+		self.assertIsInstance(module_outputs["M18"], dict)
+		self.assertTrue(module_outputs["M18"]["pass"])
+		self.assertTrue(module_outputs["M19"]["pass"])
 		self.assertFalse(result["fallback"]["triggered"])
 
 	def test_bad_path_triggers_fallback(self) -> None:
@@ -90,3 +93,15 @@ class ACAM14M20Tests(TestCase):
 		self.assertEqual(result["mode"], "clarify")
 		self.assertTrue(result["fallback"]["triggered"])
 		self.assertEqual(result["fallback"]["reason_code"], "untrusted_tool_instruction_detected")
+
+	def test_conflict_resolution_dedupes_refined_plan_case_insensitively(self) -> None:
+		def _duplicate_result(**kwargs):
+			result = _good_result(**kwargs)
+			result["plan"] = [*result["plan"], "implement   CORE path", "Implement core path"]
+			return result
+
+		orchestrator = ACAOrchestrator(ACAOrchestratorHooks(build_result=_duplicate_result))
+		result, _trace = orchestrator.run(self._request("Create an implementation plan."))
+		self.assertEqual(result["module_outputs"]["M17"]["strategy_used"], "dedupe")
+		self.assertEqual(result["module_outputs"]["M17"]["plan_length"], 4)
+		self.assertEqual([step.lower() for step in result["plan"]].count("implement core path"), 1)
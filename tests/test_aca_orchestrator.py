@@ -1,7 +1,8 @@
 from unittest import TestCase
 
 from app.backend.aca.orchestrator import ACAOrchestrator, ACAOrchestratorHooks
-from app.backend.aca.types import ACARequest
+from app.backend.aca.trace import make_event, serialize_trace
+from app.backend.aca.types import ACARequest, ACATraceBuffer
 
 
 def _dummy_build_result(**_kwargs):
@@ -112,3 +113,25 @@ class ACAOrchestratorTests(TestCase):
 		self.assertIn("candidate_response", result)
 		self.assertIn("quality", result)
 		self.assertIn("notes", result)
+
+	def test_trace_buffer_serializes_like_event_list(self) -> None:
+		buffer = ACATraceBuffer()
+		events = [
+			make_event(module_id="M0", module_name="SafetyMemoryGuard", tier="tier0_safety", status="pass", detail="ok"),
+			make_event(module_id="M18", module_name="TaskIntegrity", tier="tier3_operational", status="blocked", detail="failed"),
+		]
+		for event in events:
+			buffer.append(event)
+		self.assertEqual(len(buffer), 2)
+		self.assertEqual(buffer.events(), events)
+		self.assertEqual(serialize_trace(buffer), serialize_trace(events))
+
+	def test_trace_timestamps_are_stamped_per_stage(self) -> None:
+		orchestrator = ACAOrchestrator(ACAOrchestratorHooks(build_result=_dummy_build_result))
+		_result, trace = orchestrator.run(self._make_request("Build a robust assistant plan."))
+		index = {item["module_id"]: i for i, item in enumerate(trace)}
+		before = {event["timestamp"] for event in trace[: index["M14"]]}
+		after = {event["timestamp"] for event in trace[index["M14"] :]}
+		self.assertEqual(len(before), 1)
+		self.assertEqual(len(after), 1)
+		self.assertLessEqual(before.pop(), after.pop())
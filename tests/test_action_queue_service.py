@@ -8,7 +8,9 @@ from unittest.mock import patch
 
 from app.backend import constants
 from app.backend.adapters import sqlite_adapter
+from app.backend.services import action_queue_service
 from app.backend.services.action_queue_service import build_action_queue
+from app.backend.validators.playbook_parser import parse_findings
 from app.backend.validators.types import InvariantResult, ValidatorContext, ValidatorReport
 
 
@@ -216,3 +218,39 @@ class ActionQueueTests(TestCase):
 				actions = build_action_queue(_report({}), ctx)
 
 		self.assertTrue(any(action["tier"] == 2 and action["type"] == "run_validate" for action in actions))
+
+	def test_parsed_docs_are_reused_until_the_file_changes(self) -> None:
+		with TemporaryDirectory() as tmpdir:
+			root = Path(tmpdir)
+			rfc_path = root / "rfc.md"
+			matrix_path = root / "matrix.md"
+			playbook_path = root / "playbook.md"
+			db_path = root / "state.db"
+
+			rfc_path.write_text("## 6.2\nThis SHOULD be tracked.\n", encoding="utf-8")
+			matrix_path.write_text(_matrix_text([("R-6.2-01", "RFC 6.2:L2", "partial", "F-010")]), encoding="utf-8")
+			playbook_path.write_text("## Wave 2\n### F-010\nImpacted Requirement IDs:\n- `R-6.2-01`\n", encoding="utf-8")
+			sqlite_adapter.init_db(str(db_path))
+			ctx = ValidatorContext(
+				rfc_path=str(rfc_path),
+				matrix_path=str(matrix_path),
+				playbook_path=str(playbook_path),
+				handoff_path=str(root / "handoff.md"),
+				workspace_root=str(root),
+				state_db_path=str(db_path),
+			)
+
+			with patch.object(action_queue_service, "parse_findings", wraps=parse_findings) as parser:
+				first = build_action_queue(_report({}), ctx)
+				second = build_action_queue(_report({}), ctx)
+				self.assertEqual(parser.call_count, 1)
+				self.assertEqual(first, second)
+
+				playbook_path.write_text(
+					"## Wave 2\n### F-010\nImpacted Requirement IDs:\n- `R-6.2-01`\n### F-011\n",
+					encoding="utf-8",
+				)
+				third = build_action_queue(_report({}), ctx)
+				self.assertEqual(parser.call_count, 2)
+
+		self.assertIn("F-011", [action["target"] for action in third])
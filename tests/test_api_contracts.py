@@ -1,11 +1,12 @@
 import os
 import tempfile
 from pathlib import Path
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from fastapi.testclient import TestClient
 
 from app.backend.main import app
+from app.backend.routers import assistant as assistant_router
 from app.backend.validators.playbook_parser import parse_findings
 
 
@@ -98,6 +99,54 @@ class ApiContractsTests(TestCase):
 		self.assertIn("provider_warnings", payload["data"])
 		self.assertGreaterEqual(len(payload["data"]["models"]), 1)
 
+	def test_assistant_models_endpoint_honors_etag(self) -> None:
+		first = self.client.get("/api/assistant/models")
+		etag = first.headers["ETag"]
+		cached = self.client.get("/api/assistant/models", headers={"If-None-Match": etag})
+		self.assertEqual(cached.status_code, 304)
+		self.assertEqual(cached.headers["ETag"], etag)
+		os.environ["ASSISTANT_PROVIDER_MODE"] = "openai"
+		changed = self.client.get("/api/assistant/models", headers={"If-None-Match": etag})
+		self.assertEqual(changed.status_code, 200)
+		self.assertNotEqual(changed.headers["ETag"], etag)
+
+	def test_assistant_stream_error_ends_with_error_frame(self) -> None:
+		def failing_stream(**_kwargs):
+			yield "meta", {"session_id": "api-contract-stream"}
+			raise RuntimeError("provider exploded")
+
+		with mock.patch("app.backend.services.assistant_service.stream_v2", failing_stream):
+			response = self.client.post("/api/assistant/stream-v2", json={"user_input": "Plan the rollout."})
+		self.assertEqual(response.status_code, 200)
+		frames = response.text.strip().split("\n\n")
+		self.assertEqual(frames[0], 'event: meta\ndata: {"session_id": "api-contract-stream"}')
+		self.assertEqual(
+			frames[-1],
+			'event: error\ndata: {"code": "assistant_provider_error", "message": "Assistant stream failed."}',
+		)
+
+	def test_sse_frames_flush_meta_then_coalesce_burst(self) -> None:
+		events = [("meta", {"session_id": "s"})]
+		events += [("delta", {"text": f"chunk-{index}"}) for index in range(5)]
+		events.append(("done", {"ok": True}))
+		chunks = list(assistant_router._sse_frames(iter(events)))
+		self.assertEqual(len(chunks), 2)
+		self.assertEqual(chunks[0], b'event: meta\ndata: {"session_id": "s"}\n\n')
+		self.assertEqual(chunks[1].count(b"event: delta"), 5)
+		self.assertTrue(chunks[1].endswith(b'event: done\ndata: {"ok": true}\n\n'))
+
+	def test_json_responses_are_gzipped_but_streams_are_not(self) -> None:
+		body = {"user_input": "Build a practical implementation plan with fallback behavior."}
+		response = self.client.post("/api/assistant/respond-v2", headers={"Accept-Encoding": "gzip"}, json=body)
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.headers.get("Content-Encoding"), "gzip")
+		with self.client.stream(
+			"POST", "/api/assistant/stream-v2", headers={"Accept-Encoding": "gzip"}, json=body
+		) as stream:
+			self.assertEqual(stream.status_code, 200)
+			self.assertNotIn("Content-Encoding", stream.headers)
+			self.assertIn("event: done", "".join(stream.iter_text()))
+
 	def test_assistant_respond_v2_endpoint_contract(self) -> None:
 		response = self.client.post(
 			"/api/assistant/respond-v2",
@@ -1,4 +1,7 @@
 import os
+from collections import OrderedDict
+from itertools import count
+from threading import Thread
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -120,6 +123,44 @@ class AssistantProviderTests(TestCase):
 		self.assertIn("5.", candidate)
 		self.assertNotIn("6.", candidate)
 
+	def test_adaptive_session_state_expires_least_recently_used_first(self) -> None:
+		with patch.object(assistant_service, "_ADAPTIVE_SESSION_STATE", OrderedDict()), patch.object(
+			assistant_service, "_adaptive_ttl_seconds", return_value=60
+		), patch("app.backend.services.assistant_service.time.monotonic") as monotonic:
+			monotonic.return_value = 1000.0
+			first = assistant_service._adaptive_state_for_session("first")
+			monotonic.return_value = 1030.0
+			assistant_service._adaptive_state_for_session("second")
+			monotonic.return_value = 1050.0
+			self.assertIs(assistant_service._adaptive_state_for_session("first"), first)
+			monotonic.return_value = 1100.0
+			assistant_service._adaptive_state_for_session("third")
+			self.assertEqual(list(assistant_service._ADAPTIVE_SESSION_STATE), ["first", "third"])
+
+	def test_adaptive_turn_is_not_blocked_by_another_busy_session(self) -> None:
+		busy_lock = assistant_service._adaptive_turn_lock("busy-session")
+		other_session = next(
+			f"other-{index}"
+			for index in count()
+			if assistant_service._adaptive_turn_lock(f"other-{index}") is not busy_lock
+		)
+		results = []
+		with patch.dict(
+			os.environ,
+			{"ASSISTANT_PROVIDER_MODE": "local", "ASSISTANT_OPENAI_MODELS": "gpt-4.1-mini"},
+			clear=False,
+		), busy_lock:
+			worker = Thread(
+				target=lambda: results.append(
+					assistant_service.respond(user_input="Build a login API with tests", session_id=other_session)
+				),
+				daemon=True,
+			)
+			worker.start()
+			worker.join(timeout=10)
+		self.assertFalse(worker.is_alive())
+		self.assertEqual(len(results), 1)
+
 	def test_model_catalog_returns_allowlist(self) -> None:
 		with patch.dict(
 			os.environ,
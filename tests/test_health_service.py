@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.backend import constants
+from app.backend.services import health_service
+
+
+class HealthSummaryCacheTests(TestCase):
+	def setUp(self) -> None:
+		health_service.clear_summary_cache()
+
+	def tearDown(self) -> None:
+		health_service.clear_summary_cache()
+
+	def test_summary_is_reused_within_ttl_and_rebuilt_after_clear(self) -> None:
+		built = {"coverage": {"covered": 1, "partial": 0, "gap": 0}}
+		with patch.object(health_service, "_build_summary", return_value=built) as build:
+			first = health_service.get_summary()
+			first["coverage"]["covered"] = 99
+			second = health_service.get_summary()
+			self.assertEqual(build.call_count, 1)
+			self.assertEqual(second["coverage"]["covered"], 1)
+
+			with patch.object(constants, "DEFAULT_DB_PATH", "other_state.db"):
+				health_service.get_summary()
+			self.assertEqual(build.call_count, 2)
+
+			health_service.clear_summary_cache()
+			health_service.get_summary()
+			self.assertEqual(build.call_count, 3)
+
+			with patch.object(health_service, "_SUMMARY_TTL_S", 0.0):
+				health_service.get_summary()
+			self.assertEqual(build.call_count, 4)
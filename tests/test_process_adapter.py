@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.backend.adapters import process_adapter
+
+
+class ProcessAdapterAsyncTests(TestCase):
+	def _run_recording(self, command, coro_factory):
+		spawned = []
+		create = asyncio.create_subprocess_exec
+
+		async def _recording_exec(*args, **kwargs):
+			proc = await create(*args, **kwargs)
+			spawned.append(proc)
+			return proc
+
+		with patch.object(process_adapter, "_sync_command", return_value=command), patch.object(
+			process_adapter, "_SYNC_TIMEOUT_S", 0.5
+		), patch.object(process_adapter.asyncio, "create_subprocess_exec", side_effect=_recording_exec):
+			outcome = asyncio.run(coro_factory(spawned))
+		return outcome, spawned
+
+	def test_normal_run_decodes_output_and_keeps_exit_code(self) -> None:
+		command = [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'one\\r\\ntwo\\rthree\\n'); sys.exit(3)"]
+
+		async def _run(_spawned):
+			return await process_adapter.run_sync_process_async()
+
+		result, spawned = self._run_recording(command, _run)
+		self.assertEqual(result["exit_code"], 3)
+		self.assertEqual(result["stdout"], "one\ntwo\nthree\n")
+		self.assertEqual(result["stderr"], "")
+		self.assertEqual(spawned[0].returncode, 3)
+
+	def test_timeout_kills_and_reaps_the_child(self) -> None:
+		command = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+		async def _run(_spawned):
+			return await process_adapter.run_sync_process_async()
+
+		result, spawned = self._run_recording(command, _run)
+		self.assertEqual(result["exit_code"], 124)
+		self.assertEqual(result["stdout"], "")
+		self.assertIn("timed out", result["stderr"])
+		self.assertIsNotNone(spawned[0].returncode)
+
+	def test_cancellation_kills_and_reaps_the_child(self) -> None:
+		command = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+		async def _run(spawned):
+			task = asyncio.create_task(process_adapter.run_sync_process_async())
+			while not spawned:
+				await asyncio.sleep(0.01)
+			task.cancel()
+			try:
+				await task
+			except asyncio.CancelledError:
+				return "cancelled"
+			return "finished"
+
+		outcome, spawned = self._run_recording(command, _run)
+		self.assertEqual(outcome, "cancelled")
+		self.assertIsNotNone(spawned[0].returncode)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from app.backend import constants
+from app.backend.adapters import sqlite_adapter
+from app.backend.services import state_service
+
+
+_MATRIX_HEAD = (
+	"| Req ID | Requirement | Source | Status | Finding | Enforcement Point | Test | Telemetry Proof |\n"
+	"| --- | --- | --- | --- | --- | --- | --- | --- |\n"
+)
+
+
+class StateServiceTests(TestCase):
+	def test_indexed_filters_follow_state_and_file_changes(self) -> None:
+		with TemporaryDirectory() as tmpdir:
+			root = Path(tmpdir)
+			rfc_path = root / "rfc.md"
+			matrix_path = root / "matrix.md"
+			playbook_path = root / "playbook.md"
+			db_path = root / "state.db"
+
+			rfc_path.write_text("## 4.1\nThis MUST be mapped.\n", encoding="utf-8")
+			matrix_path.write_text(
+				_MATRIX_HEAD
+				+ "| R-4.1-01 | Requirement | RFC 4.1:L2 | gap | F-001 | TBD | TBD | TBD |\n"
+				+ "| R-6.2-01 | Requirement | RFC 6.2:L4 | partial | F-001, F-010 | TBD | TBD | TBD |\n",
+				encoding="utf-8",
+			)
+			playbook_path.write_text(
+				"## Wave 1\n### F-001\nImpacted Requirement IDs:\n- `R-4.1-01`\n\n"
+				"## Wave 2\n### F-010\nImpacted Requirement IDs:\n- `R-6.2-01`\n",
+				encoding="utf-8",
+			)
+			sqlite_adapter.init_db(str(db_path))
+			sqlite_adapter.upsert_finding_state("F-010", "blocked", None, db_path=str(db_path))
+
+			with patch.object(constants, "DEFAULT_RFC_PATH", str(rfc_path)), patch.object(
+				constants, "DEFAULT_MATRIX_PATH", str(matrix_path)
+			), patch.object(constants, "DEFAULT_PLAYBOOK_PATH", str(playbook_path)), patch.object(
+				constants, "DEFAULT_DB_PATH", str(db_path)
+			):
+				self.assertEqual([row["finding_id"] for row in state_service.list_findings(wave=1)], ["F-001"])
+				self.assertEqual([row["finding_id"] for row in state_service.list_findings(status="blocked")], ["F-010"])
+				self.assertEqual([row["finding_id"] for row in state_service.list_findings(status="unstarted")], ["F-001"])
+				self.assertEqual(state_service.list_findings(wave=1, is_blocker=False), [])
+
+				linked = state_service.list_requirements(finding="F-001", section="6.2")
+				self.assertEqual([row["req_id"] for row in linked], ["R-6.2-01"])
+				self.assertEqual(linked[0]["linked_findings"], ["F-001", "F-010"])
+				linked[0]["linked_findings"].append("F-999")
+				self.assertEqual(state_service.list_requirements(req_id="R-6.2-01")[0]["linked_findings"], ["F-001", "F-010"])
+				self.assertEqual(state_service.list_requirements(req_id="R-4.1-01")[0]["normative_level"], "MUST")
+
+				playbook_path.write_text(
+					"## Wave 1\n### F-001\n### F-010\nImpacted Requirement IDs:\n- `R-6.2-01`\n",
+					encoding="utf-8",
+				)
+				self.assertEqual(
+					[row["finding_id"] for row in state_service.list_findings(is_blocker=True)],
+					["F-001", "F-010"],
+				)
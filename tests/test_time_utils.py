@@ -0,0 +1,21 @@
+from datetime import datetime, timedelta, timezone
+from unittest import TestCase, mock
+
+from app.backend import time_utils
+
+
+class TimeUtilsTests(TestCase):
+	def _expected(self, nanos: int) -> str:
+		moment = datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(microseconds=nanos // 1000)
+		return moment.isoformat().replace("+00:00", "Z")
+
+	def test_now_iso_matches_datetime_isoformat(self) -> None:
+		for nanos in (
+			1_792_137_600_000_000_000,
+			1_792_137_600_000_000_999,
+			1_792_137_600_123_456_789,
+			1_792_137_601_000_001_000,
+			951_782_399_999_999_999,
+		):
+			with mock.patch.object(time_utils.time, "time_ns", return_value=nanos):
+				self.assertEqual(time_utils.now_iso(), self._expected(nanos))